@@ -65,11 +65,11 @@ class Game:
 
     def handle_events(self) -> None:
         """Handle pygame events."""
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.game_loop.stop()
-            # Pass events to input manager
-            self.input.process_event(event)
+        self.input.process_events(events)
 
     def update(self, dt: float) -> None:
         """Update game state.
@@ -20,7 +20,7 @@ def player_system(world: World, dt: float) -> None:
     """
     keys = pygame.key.get_pressed()
 
-    for entity in world.get_entities_with_component(PlayerController):
+    for entity, _ in world.query(PlayerController, Physics):
         controller = entity.get_component(PlayerController)
         physics = entity.get_component(Physics)
 
@@ -68,8 +68,11 @@ class PhysicsSystem:
 
     def update(self, world: World, delta_time: float) -> None:
         """Update the physics system."""
+        # Static colliders don't move during the update, so collect them once
+        static_entities = get_static_entities(world)
+
         # Update physics for each entity with a physics body
-        for entity in world.get_entities_with_component(Physics):
+        for entity, _ in world.query(Physics, BoxCollider, Transform):
             physics = entity.get_component(Physics)
             collider = entity.get_component(BoxCollider)
             transform = entity.get_component(Transform)
@@ -112,7 +115,7 @@ class PhysicsSystem:
                 physics.velocity.y = 0
 
             # Check for collisions with static colliders
-            for other in world.get_entities_with_component(BoxCollider):
+            for other in static_entities:
                 if entity == other:
                     continue
 
@@ -4,7 +4,15 @@ import sys
 
 import pygame
 
-from src.core.ui import Button, ButtonStyle, Text, TextConfig, UIElement, UIRect
+from src.core.ui import (
+    Button,
+    ButtonStyle,
+    Text,
+    TextConfig,
+    UIElement,
+    UIRect,
+    set_screen_rect,
+)
 from src.core.window import Window, WindowConfig
 
 
@@ -18,6 +26,7 @@ class UIDemo:
             title="UI System Demo", width=800, height=600, scale=1, vsync=True
         )
         self.window = Window(config)
+        set_screen_rect(self.window.surface.get_rect())
         self.running = True
         self.clock = pygame.time.Clock()
 
@@ -0,0 +1,7 @@
+"""Compatibility helpers for the Python versions supported by the engine."""
+import sys
+from typing import Any, Dict
+
+# Keyword arguments for ``@dataclass`` that give instances ``__slots__`` where
+# the running interpreter supports it (Python 3.10+).
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -1,5 +1,7 @@
 """Audio system for the game engine."""
-from typing import Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
 
 import pygame
 
@@ -11,13 +13,21 @@ __all__ = ["AudioClip", "AudioClipConfig", "AudioManager", "Audio"]
 
 """Audio management module."""
 
+# How long, in seconds, polled music state is reused before asking SDL again;
+# about one frame, so HUD code polling every frame costs one call per frame
+_MUSIC_POLL_INTERVAL = 0.016
+
 
 class Audio:
     """Static class for managing audio playback."""
 
-    # Class variables for caching sounds
-    _sounds: Dict[str, pygame.mixer.Sound] = {}
+    # Decoded sounds by path, least recently played first
+    _sounds: "OrderedDict[str, pygame.mixer.Sound]" = OrderedDict()
+    _max_cached_sounds = 64
     _current_music: Optional[str] = None
+    # (value, time.perf_counter() of the read) for polled music state
+    _music_volume: Optional[Tuple[float, float]] = None
+    _music_busy: Optional[Tuple[bool, float]] = None
 
     @classmethod
     def initialize(cls) -> None:
@@ -35,20 +45,54 @@ class Audio:
         if not (0.0 <= volume <= 1.0):
             raise ValueError("Volume must be between 0.0 and 1.0")
 
-        # Cache sound if not already loaded
-        if sound_path not in cls._sounds:
-            try:
-                cls._sounds[sound_path] = pygame.mixer.Sound(sound_path)
-            except FileNotFoundError:
-                raise FileNotFoundError(f"Sound file not found: {sound_path}")
-            except pygame.error as e:
-                raise pygame.error(f"Error loading sound: {e}")
-
-        # Play the sound
-        sound = cls._sounds[sound_path]
+        sound = cls._load_sound(sound_path)
         sound.set_volume(volume)
         sound.play()
 
+    @classmethod
+    def preload_sounds(cls, sound_paths: Iterable[str]) -> None:
+        """Decode sound effects ahead of time so their first play is instant.
+
+        Args:
+            sound_paths: Paths to the sound files
+        """
+        for sound_path in sound_paths:
+            cls._load_sound(sound_path)
+
+    @classmethod
+    def _load_sound(cls, sound_path: str) -> pygame.mixer.Sound:
+        """Get a decoded sound, loading it on first use.
+
+        The cache keeps at most _max_cached_sounds sounds and evicts the one
+        played least recently.
+
+        Args:
+            sound_path: Path to the sound file
+
+        Returns:
+            The decoded sound
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            pygame.error: If the file cannot be decoded
+        """
+        sounds = cls._sounds
+        sound = sounds.get(sound_path)
+        if sound is not None:
+            sounds.move_to_end(sound_path)
+            return sound
+
+        try:
+            sound = pygame.mixer.Sound(sound_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Sound file not found: {sound_path}")
+        except pygame.error as e:
+            raise pygame.error(f"Error loading sound: {e}")
+        sounds[sound_path] = sound
+        if len(sounds) > cls._max_cached_sounds:
+            sounds.popitem(last=False)
+        return sound
+
     @classmethod
     def play_music(
         cls, music_path: str, volume: float = 1.0, loop: bool = True
@@ -68,6 +112,7 @@ class Audio:
             pygame.mixer.music.set_volume(volume)
             pygame.mixer.music.play(-1 if loop else 0)
             cls._current_music = music_path
+            cls._invalidate_music_state()
         except FileNotFoundError:
             raise FileNotFoundError(f"Music file not found: {music_path}")
         except pygame.error as e:
@@ -78,16 +123,19 @@ class Audio:
         """Stop currently playing music."""
         pygame.mixer.music.stop()
         cls._current_music = None
+        cls._invalidate_music_state()
 
     @classmethod
     def pause_music(cls) -> None:
         """Pause currently playing music."""
         pygame.mixer.music.pause()
+        cls._invalidate_music_state()
 
     @classmethod
     def unpause_music(cls) -> None:
         """Unpause currently playing music."""
         pygame.mixer.music.unpause()
+        cls._invalidate_music_state()
 
     @classmethod
     def set_music_volume(cls, volume: float) -> None:
@@ -99,27 +147,44 @@ class Audio:
         if not (0.0 <= volume <= 1.0):
             raise ValueError("Volume must be between 0.0 and 1.0")
         pygame.mixer.music.set_volume(volume)
+        cls._invalidate_music_state()
 
     @classmethod
     def get_music_volume(cls) -> float:
         """Get the current music volume.
 
+        The value is polled from the mixer at most once per frame interval.
+
         Returns:
             float: Current volume level between 0.0 and 1.0
         """
+        now = time.perf_counter()
+        cached = cls._music_volume
+        if cached is not None and now - cached[1] < _MUSIC_POLL_INTERVAL:
+            return cached[0]
         try:
-            return float(pygame.mixer.music.get_volume())
+            volume = float(pygame.mixer.music.get_volume())
         except pygame.error:
             return 0.0
+        cls._music_volume = (volume, now)
+        return volume
 
     @classmethod
     def is_music_playing(cls) -> bool:
         """Check if music is currently playing.
 
+        The state is polled from the mixer at most once per frame interval.
+
         Returns:
             True if music is playing, False otherwise
         """
-        return bool(pygame.mixer.music.get_busy())
+        now = time.perf_counter()
+        cached = cls._music_busy
+        if cached is not None and now - cached[1] < _MUSIC_POLL_INTERVAL:
+            return cached[0]
+        busy = bool(pygame.mixer.music.get_busy())
+        cls._music_busy = (busy, now)
+        return busy
 
     @classmethod
     def fade_out_music(cls, time_ms: int) -> None:
@@ -130,6 +195,7 @@ class Audio:
         """
         pygame.mixer.music.fadeout(time_ms)
         cls._current_music = None
+        cls._invalidate_music_state()
 
     @classmethod
     def queue_music(cls, music_path: str) -> None:
@@ -157,9 +223,16 @@ class Audio:
         except pygame.error as e:
             raise pygame.error(f"Error setting music position: {e}")
 
+    @classmethod
+    def _invalidate_music_state(cls) -> None:
+        """Drop polled music state after a call that changes it."""
+        cls._music_volume = None
+        cls._music_busy = None
+
     @classmethod
     def cleanup(cls) -> None:
         """Clean up audio resources."""
         pygame.mixer.quit()
         cls._sounds.clear()
         cls._current_music = None
+        cls._invalidate_music_state()
@@ -200,3 +200,18 @@ class AudioManager:
         for channel in self._channels.values():
             channel.stop()
         self._channels.clear()
+
+    def reset(self) -> None:
+        """Stop all playback and restore the state of a new manager.
+
+        Loaded clips are forgotten and all volumes go back to 1.0. The mixer
+        itself stays open.
+        """
+        self.stop_all()
+        pygame.mixer.stop()  # Including sounds played outside the manager
+        self._clips.clear()
+        self._master_volume = 1.0
+        self._music_volume = 1.0
+        self._sound_volume = 1.0
+        self._next_channel_id = 0
+        self._update_volumes()
@@ -12,6 +12,9 @@ class Component:
     They should not contain any game logic, only data and properties.
     """
 
+    # Subclasses that also declare __slots__ get instances without a __dict__
+    __slots__ = ("_entity", "_enabled")
+
     def __init__(self) -> None:
         """Initialize the component."""
         self._entity: "Entity | None" = None
@@ -1,31 +1,52 @@
 """Entity class for the Entity Component System."""
-from typing import Dict, Optional, Type, TypeVar
-from uuid import uuid4
+from itertools import count
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Type, TypeVar
 
 from .component import Component
 
+if TYPE_CHECKING:
+    from .world import World
+
 T = TypeVar("T", bound=Component)
 
+# Entity IDs pack a 32-bit slot index with a 32-bit generation above it
+INDEX_MASK = 0xFFFFFFFF
+GENERATION_SHIFT = 32
+# Entities built outside a World get IDs above every generational ID
+_DETACHED_ID_FLAG = 1 << 64
+
 
 class Entity:
     """Base class for all game entities.
 
     An entity is a container for components that define its behavior and data.
-    Each entity has a unique ID and can be part of a parent-child hierarchy.
+    Each entity has a unique integer ID and can be part of a parent-child
+    hierarchy. IDs handed out by a World are generational: the low 32 bits are
+    a slot index that the world reuses, and the bits above count how many
+    times that slot was reused, so a stale ID never matches a newer entity.
     """
 
-    def __init__(self, name: str = "") -> None:
+    # Process-wide ID source for detached entities; next() is atomic under the GIL
+    _id_counter = count(1)
+
+    def __init__(self, name: str = "", entity_id: Optional[int] = None) -> None:
         """Initialize the entity.
 
         Args:
-            name: Optional name for the entity (default: auto-generated)
+            name: Optional name for the entity (default: auto-generated from
+                the full ID, so it is unique)
+            entity_id: ID assigned by the owning World (default: a new
+                process-wide ID outside any world's range)
         """
-        self.id = str(uuid4())
-        self.name = name or f"Entity_{self.id[:8]}"
+        if entity_id is None:
+            entity_id = _DETACHED_ID_FLAG | next(Entity._id_counter)
+        self.id = entity_id
+        self.name = name or f"Entity_{entity_id:x}"
         self._components: Dict[Type[Component], Component] = {}
-        self._children: Dict[str, "Entity"] = {}
+        self._children: Dict[int, "Entity"] = {}
         self._parent: Optional["Entity"] = None
         self._enabled = True
+        self._world: Optional["World"] = None  # Set by the owning World
 
     @property
     def enabled(self) -> bool:
@@ -55,7 +76,7 @@ class Entity:
         return self._components
 
     @property
-    def children(self) -> Dict[str, "Entity"]:
+    def children(self) -> Dict[int, "Entity"]:
         """Get the children dictionary.
 
         Returns:
@@ -135,9 +156,42 @@ class Entity:
             )
 
         self._components[component_type] = component
+        if self._world is not None:
+            self._world._on_component_added(self, component)
         component.entity = self
         component.on_attach()
 
+    def add_components(self, components: Iterable[Component]) -> None:
+        """Add several components to the entity at once.
+
+        All components are checked before any is added, so a duplicate leaves
+        the entity unchanged. Components are attached in the given order after
+        all of them are registered, letting one component's on_attach find
+        another from the same batch.
+
+        Args:
+            components: Components to add
+
+        Raises:
+            ValueError: If a component type is already present or repeated
+        """
+        new_components: Dict[Type[Component], Component] = {}
+        for component in components:
+            component_type = type(component)
+            if component_type in self._components or component_type in new_components:
+                raise ValueError(
+                    f"Entity '{self.name}' already has a {component_type.__name__}"
+                )
+            new_components[component_type] = component
+
+        self._components.update(new_components)
+        if self._world is not None:
+            for component in new_components.values():
+                self._world._on_component_added(self, component)
+        for component in new_components.values():
+            component.entity = self
+            component.on_attach()
+
     def remove_component(self, component_type: Type[T]) -> None:
         """Remove a component from the entity.
 
@@ -149,6 +203,8 @@ class Entity:
             component.on_detach()
             component.entity = None
             del self._components[component_type]
+            if self._world is not None:
+                self._world._on_component_removed(self, component_type)
 
     def get_component(self, component_type: Type[T]) -> Optional[T]:
         """Get a component by type.
@@ -181,6 +237,6 @@ class Entity:
         return (
             f"{self.__class__.__name__}("
             f"name='{self.name}', "
-            f"id='{self.id}', "
+            f"id={self.id}, "
             f"enabled={self._enabled})"
         )
@@ -0,0 +1,127 @@
+"""Sparse set storage for the components of a single type."""
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+
+from .component import Component
+
+if TYPE_CHECKING:
+    from .entity import Entity
+
+
+class SparseSet:
+    """Packed storage for every component of one type in a world.
+
+    Entities and their components live in two parallel dense lists, and a
+    sparse index maps entity IDs to their position. Membership, insertion and
+    removal are O(1), and iteration walks the dense list without gaps.
+    Removal swaps the last element into the freed slot, so order is not
+    preserved.
+    """
+
+    __slots__ = ("entities", "components", "_index")
+
+    def __init__(self) -> None:
+        """Initialize an empty set."""
+        self.entities: List["Entity"] = []
+        self.components: List[Component] = []
+        self._index: Dict[int, int] = {}
+
+    def add(self, entity: "Entity", component: Component) -> None:
+        """Store a component for an entity, replacing any existing one.
+
+        Args:
+            entity: Entity that owns the component
+            component: Component to store
+        """
+        index = self._index.get(entity.id)
+        if index is not None:
+            self.components[index] = component
+            return
+        self._index[entity.id] = len(self.entities)
+        self.entities.append(entity)
+        self.components.append(component)
+
+    def remove(self, entity: "Entity") -> None:
+        """Remove an entity's component if present.
+
+        Args:
+            entity: Entity whose component to remove
+        """
+        index = self._index.pop(entity.id, None)
+        if index is None:
+            return
+        last_entity = self.entities.pop()
+        last_component = self.components.pop()
+        if index < len(self.entities):
+            # Move the former last element into the hole
+            self.entities[index] = last_entity
+            self.components[index] = last_component
+            self._index[last_entity.id] = index
+
+    def remove_many(self, entities: Iterable["Entity"]) -> None:
+        """Remove the components of several entities in one sweep.
+
+        Positions are freed from the back of the dense lists forward, so each
+        swap moves an element that is known to stay.
+
+        Args:
+            entities: Entities whose components to remove; ones not in the
+                set are ignored
+        """
+        index = self._index
+        positions = sorted(
+            (index.pop(entity.id) for entity in entities if entity.id in index),
+            reverse=True,
+        )
+        dense_entities = self.entities
+        dense_components = self.components
+        for position in positions:
+            last_entity = dense_entities.pop()
+            last_component = dense_components.pop()
+            if position < len(dense_entities):
+                dense_entities[position] = last_entity
+                dense_components[position] = last_component
+                index[last_entity.id] = position
+
+    def get(self, entity: "Entity") -> Optional[Component]:
+        """Get an entity's component.
+
+        Args:
+            entity: Entity to look up
+
+        Returns:
+            The component if the entity has one in this set, None otherwise
+        """
+        index = self._index.get(entity.id)
+        return None if index is None else self.components[index]
+
+    def __getitem__(self, entity: "Entity") -> Component:
+        """Get the component of an entity known to be in the set.
+
+        Args:
+            entity: Entity to look up
+
+        Returns:
+            The entity's component
+
+        Raises:
+            KeyError: If the entity has no component in this set
+        """
+        return self.components[self._index[entity.id]]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self.entities.clear()
+        self.components.clear()
+        self._index.clear()
+
+    def __contains__(self, entity: object) -> bool:
+        """Check whether an entity has a component in this set."""
+        return getattr(entity, "id", None) in self._index
+
+    def __len__(self) -> int:
+        """Get the number of stored components."""
+        return len(self.entities)
+
+    def __iter__(self) -> Iterator["Entity"]:
+        """Iterate over the entities in dense order."""
+        return iter(self.entities)
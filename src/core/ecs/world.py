@@ -1,8 +1,22 @@
 """World class for the Entity Component System."""
-from typing import Callable, Dict, List, Optional, Set, Type, TypeVar
+from itertools import count
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from .component import Component
-from .entity import Entity
+from .entity import GENERATION_SHIFT, INDEX_MASK, Entity
+from .sparse_set import SparseSet
 
 T = TypeVar("T", bound=Component)
 
@@ -12,15 +26,61 @@ class World:
 
     The World class manages the lifecycle of entities and coordinates
     system updates. It provides methods for entity creation, querying,
-    and cleanup.
+    and cleanup. Components of each type are kept in a SparseSet that the
+    world's entities update as components are added and removed, so queries
+    never scan the entity table. Multi-component queries are cached by their
+    type set and kept current as components come and go, so repeated
+    queries skip the matching step entirely.
     """
 
+    # Process-wide world numbering; keeps default entity names unique across worlds
+    _serials = count(1)
+
     def __init__(self) -> None:
         """Initialize the world."""
-        self._entities: Dict[str, Entity] = {}
+        self._serial = next(World._serials)
+        # Entity slots indexed by the low bits of the ID; None marks a free slot
+        self._entities: List[Optional[Entity]] = []
+        self._generations: List[int] = []
+        self._free_indices: List[int] = []
+        self._entity_count = 0
         self._systems: List[Callable[[float], None]] = []
-        self._component_cache: Dict[Type[Component], Set[Entity]] = {}
-        self._pending_removal: Set[str] = set()
+        self._pools: Dict[Type[Component], SparseSet] = {}
+        # Matching entities, by ID, for each multi-component query seen so far
+        self._query_cache: Dict[FrozenSet[Type[Component]], Dict[int, Entity]] = {}
+        self._pending_removal: Set[int] = set()
+
+    @property
+    def entity_count(self) -> int:
+        """Get the number of live entities.
+
+        Returns:
+            Number of entities in the world, including ones pending removal
+        """
+        return self._entity_count
+
+    def _spawn(self, name: str) -> Entity:
+        """Create an entity in a free slot, or a new one.
+
+        Args:
+            name: Name for the entity, or "" for one built from the world's
+                serial number and the entity's full ID
+
+        Returns:
+            The created entity
+        """
+        if self._free_indices:
+            index = self._free_indices.pop()
+        else:
+            index = len(self._entities)
+            self._entities.append(None)
+            self._generations.append(0)
+        entity_id = (self._generations[index] << GENERATION_SHIFT) | index
+        entity = Entity(name or f"Entity_{self._serial:x}_{entity_id:x}", entity_id)
+        entity._world = self
+        self._entities[index] = entity
+        self._entity_count += 1
+        return entity
 
     def create_entity(self, name: str = "") -> Entity:
         """Create a new entity in the world.
@@ -31,9 +91,29 @@ class World:
         Returns:
             The created entity
         """
-        entity = Entity(name)
-        self._entities[entity.id] = entity
-        return entity
+        return self._spawn(name)
+
+    def create_entities(
+        self, count: int, names: Optional[Sequence[str]] = None
+    ) -> List[Entity]:
+        """Create several entities in the world at once.
+
+        Args:
+            count: Number of entities to create
+            names: Optional names for the entities, one per entity
+
+        Returns:
+            The created entities, in creation order
+
+        Raises:
+            ValueError: If names is given and its length is not count
+        """
+        if names is None:
+            names = [""] * count
+        elif len(names) != count:
+            raise ValueError(f"Expected {count} names, got {len(names)}")
+        spawn = self._spawn
+        return [spawn(name) for name in names]
 
     def remove_entity(self, entity: Entity) -> None:
         """Mark an entity for removal.
@@ -45,16 +125,26 @@ class World:
         """
         self._pending_removal.add(entity.id)
 
-    def get_entity(self, entity_id: str) -> Optional[Entity]:
+    def get_entity(self, entity_id: int) -> Optional[Entity]:
         """Get an entity by its ID.
 
         Args:
             entity_id: ID of the entity to get
 
         Returns:
-            Entity if found, None otherwise
+            Entity if found, None otherwise (including for IDs of entities
+            that were removed, even if their slot has been reused, and for
+            non-integer IDs such as the string IDs of earlier versions)
         """
-        return self._entities.get(entity_id)
+        if not isinstance(entity_id, int):
+            return None
+        index = entity_id & INDEX_MASK
+        if index >= len(self._entities):
+            return None
+        entity = self._entities[index]
+        if entity is None or entity.id != entity_id:
+            return None
+        return entity
 
     def add_system(self, system: Callable[[float], None]) -> None:
         """Add a system to the world.
@@ -67,47 +157,164 @@ class World:
         """
         self._systems.append(system)
 
-    def get_entities_with_component(self, component_type: Type[T]) -> Set[Entity]:
+    def get_entities_with_component(self, component_type: Type[T]) -> List[Entity]:
         """Get all entities that have a specific component type.
 
+        The result is a snapshot: the type's storage is copied on every call,
+        which costs O(n) but lets systems add or remove the component while
+        looping over it. Systems that run every frame should prefer query(),
+        whose matches are cached.
+
         Args:
             component_type: Type of component to query for
 
         Returns:
-            Set of entities with the component
+            List of entities with the component, in no particular order
         """
-        # Check cache first
-        if component_type in self._component_cache:
-            return self._component_cache[component_type]
+        pool = self._pools.get(component_type)
+        if pool is None:
+            return []
+        return list(pool.entities)
 
-        # Build cache
-        entities = {
-            entity
-            for entity in self._entities.values()
-            if entity.has_component(component_type)
+    def query(
+        self, *component_types: Type[Component]
+    ) -> Iterator[Tuple[Entity, Tuple[Component, ...]]]:
+        """Iterate over entities that have all of the given component types.
+
+        The first query for a set of types matches entities against the
+        smallest storage; the result is cached and updated incrementally as
+        components are added and removed, so later queries for the same set
+        only look up the components. The matches are snapshotted first, so
+        systems may add or remove components while iterating; an entity that
+        loses a queried component before it is reached is skipped.
+
+        Args:
+            *component_types: Component types every result must have
+
+        Yields:
+            (entity, components) pairs, with components in the requested order
+        """
+        if not component_types:
+            return
+        key = frozenset(component_types)
+        matches = self._query_cache.get(key)
+        if matches is None:
+            matches = self._query_cache[key] = self._match(key)
+        if not matches:
+            return
+
+        pools = [self._pools[component_type] for component_type in component_types]
+        for entity in tuple(matches.values()):
+            components = []
+            for pool in pools:
+                component = pool.get(entity)
+                if component is None:
+                    break  # Removed since the snapshot was taken
+                components.append(component)
+            else:
+                yield entity, tuple(components)
+
+    def _match(self, component_types: FrozenSet[Type[Component]]) -> Dict[int, Entity]:
+        """Find the entities that have all of the given component types.
+
+        Args:
+            component_types: Component types every match must have
+
+        Returns:
+            Matching entities by ID
+        """
+        pools = []
+        for component_type in component_types:
+            pool = self._pools.get(component_type)
+            if pool is None:
+                pool = self._pools[component_type] = SparseSet()
+            pools.append(pool)
+        driver = min(pools, key=len)
+        return {
+            entity.id: entity
+            for entity in driver.entities
+            if all(entity in pool for pool in pools)
         }
-        self._component_cache[component_type] = entities
-        return entities
+
+    def _on_component_added(self, entity: Entity, component: Component) -> None:
+        """Record a component that was added to one of this world's entities.
+
+        Args:
+            entity: Entity the component was added to
+            component: The added component
+        """
+        component_type = type(component)
+        pool = self._pools.get(component_type)
+        if pool is None:
+            pool = self._pools[component_type] = SparseSet()
+        pool.add(entity, component)
+
+        for key, matches in self._query_cache.items():
+            if component_type in key and entity.id not in matches:
+                if all(other in entity.components for other in key):
+                    matches[entity.id] = entity
+
+    def _on_component_removed(
+        self, entity: Entity, component_type: Type[Component]
+    ) -> None:
+        """Forget a component that was removed from one of this world's entities.
+
+        Args:
+            entity: Entity the component was removed from
+            component_type: Type of the removed component
+        """
+        pool = self._pools.get(component_type)
+        if pool is not None:
+            pool.remove(entity)
+
+        for key, matches in self._query_cache.items():
+            if component_type in key:
+                matches.pop(entity.id, None)
 
     def _cleanup(self) -> None:
-        """Remove pending entities and clear caches."""
+        """Remove pending entities and their components in one batch."""
         if not self._pending_removal:
             return
 
-        # Remove entities
-        for entity_id in self._pending_removal:
-            if entity := self._entities.pop(entity_id, None):
-                # Remove from parent if any
-                if entity.parent:
-                    entity.set_parent(None)
+        released = [
+            entity
+            for entity_id in self._pending_removal
+            if (entity := self.get_entity(entity_id)) is not None
+        ]
+        self._pending_removal.clear()
+        if not released:
+            return
 
-                # Detach all children
-                for child in list(entity.children.values()):
-                    child.set_parent(None)
+        # Unlink the hierarchy first so no parent outlives its removed children
+        for entity in released:
+            if entity.parent:
+                entity.set_parent(None)
+            for child in list(entity.children.values()):
+                child.set_parent(None)
 
-        # Clear component cache as it might be invalid
-        self._component_cache.clear()
-        self._pending_removal.clear()
+        # Sweep each component storage once for all of its removed entities
+        by_type: Dict[Type[Component], List[Entity]] = {}
+        for entity in released:
+            for component_type in entity.components:
+                by_type.setdefault(component_type, []).append(entity)
+        for component_type, entities in by_type.items():
+            if pool := self._pools.get(component_type):
+                pool.remove_many(entities)
+
+        released_ids = [entity.id for entity in released]
+        for matches in self._query_cache.values():
+            for entity_id in released_ids:
+                matches.pop(entity_id, None)
+
+        # Bump generations so old IDs never match a slot's next entity
+        generations = self._generations
+        for entity in released:
+            entity._world = None
+            index = entity.id & INDEX_MASK
+            self._entities[index] = None
+            generations[index] = (generations[index] + 1) & INDEX_MASK
+            self._free_indices.append(index)
+        self._entity_count -= len(released)
 
     def update(self, dt: float) -> None:
         """Update all systems.
@@ -124,6 +331,14 @@ class World:
 
     def clear(self) -> None:
         """Remove all entities from the world."""
-        self._entities.clear()
-        self._component_cache.clear()
+        for index, entity in enumerate(self._entities):
+            if entity is not None:
+                entity._world = None
+                self._entities[index] = None
+                self._generations[index] = (self._generations[index] + 1) & INDEX_MASK
+        # Hand out low slots first again
+        self._free_indices = list(reversed(range(len(self._entities))))
+        self._entity_count = 0
+        self._pools.clear()
+        self._query_cache.clear()
         self._pending_removal.clear()
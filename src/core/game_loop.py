@@ -1,14 +1,47 @@
 """Game loop implementation for managing game timing and updates."""
 import time
-from dataclasses import dataclass
-from typing import Callable, List, Optional, Tuple
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Optional, Tuple
 
 import pygame
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+# Bound once so the per-frame calls skip the module attribute lookup. sleep
+# is still looked up through the time module so tests can patch it.
+_perf_counter_ns = time.perf_counter_ns
+
+# Time left before a frame deadline that is busy-waited instead of slept,
+# since time.sleep can overshoot by about a millisecond (much more on Windows)
+_SPIN_THRESHOLD_NS = 1_000_000
+
+_NS_PER_SECOND = 1_000_000_000
+
+# Weight of the newest sample in the section timing moving averages
+_TIMING_ALPHA = 0.2
+
+
+def _smoothed(average: float, duration_ns: int) -> float:
+    """Fold a section duration into its exponential moving average.
+
+    Args:
+        average: Current average in seconds
+        duration_ns: Latest duration in nanoseconds
+
+    Returns:
+        The updated average in seconds
+    """
+    return _TIMING_ALPHA * duration_ns / _NS_PER_SECOND + (1 - _TIMING_ALPHA) * average
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class GameLoopConfig:
-    """Configuration for the game loop."""
+    """Configuration for the game loop.
+
+    Instances are immutable so the derived frame budgets computed at
+    construction always match the settings they came from.
+    """
 
     fps: int = 60
     """Target frames per second."""
@@ -22,8 +55,17 @@ class GameLoopConfig:
     fps_sample_size: int = 60
     """Number of frames to sample for FPS calculation."""
 
+    target_frame_ns: int = field(init=False, repr=False, compare=False)
+    """Frame budget in nanoseconds, derived from fps."""
+
+    max_frame_time_ns: int = field(init=False, repr=False, compare=False)
+    """max_frame_time in nanoseconds."""
+
+    max_fixed_updates: int = field(init=False, repr=False, compare=False)
+    """Most fixed updates a single frame may run."""
+
     def __post_init__(self) -> None:
-        """Validate configuration values."""
+        """Validate configuration values and derive the frame budgets."""
         if self.fps <= 0:
             raise ValueError("FPS must be greater than 0")
         if self.fixed_time_step <= 0:
@@ -33,8 +75,18 @@ class GameLoopConfig:
         if self.fps_sample_size <= 0:
             raise ValueError("FPS sample size must be greater than 0")
 
+        object.__setattr__(self, "target_frame_ns", _NS_PER_SECOND // self.fps)
+        object.__setattr__(
+            self, "max_frame_time_ns", int(self.max_frame_time * _NS_PER_SECOND)
+        )
+        object.__setattr__(
+            self,
+            "max_fixed_updates",
+            max(1, int(self.max_frame_time / self.fixed_time_step)),
+        )
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class PerformanceMetrics:
     """Performance metrics for the game loop."""
 
@@ -47,6 +99,8 @@ class PerformanceMetrics:
     update_time: float = 0.0
     render_time: float = 0.0
     idle_time: float = 0.0
+    dropped_fixed_steps: int = 0
+    """Fixed updates skipped because a frame fell too far behind."""
 
 
 class GameLoop:
@@ -67,10 +121,20 @@ class GameLoop:
         self.total_time = 0.0
         self.delta_time = 0.0
         self.physics_accumulator = 0.0
-        self._frame_times: List[float] = []
-        self._last_time: float = time.perf_counter()
+        self._frame_times: Deque[float] = deque(maxlen=self.config.fps_sample_size)
+        self._frame_time_sum = 0.0
+        # Monotonic (sample number, frame time) windows whose fronts are the
+        # minimum and maximum of the history, so neither needs a rescan
+        self._sample_count = 0
+        self._min_window: Deque[Tuple[int, float]] = deque()
+        self._max_window: Deque[Tuple[int, float]] = deque()
+        # Timestamps are integer nanoseconds so long sessions don't lose
+        # precision; they are converted to float seconds only for durations
+        self._last_time_ns: int = _perf_counter_ns()
+        self._target_frame_ns = self.config.target_frame_ns
+        self._max_fixed_updates = self.config.max_fixed_updates
+        self._next_deadline_ns = self._last_time_ns + self._target_frame_ns
         self._metrics = PerformanceMetrics()
-        self._timing_stack: List[Tuple[str, float]] = []
 
     def start(self) -> None:
         """Start the game loop."""
@@ -79,8 +143,15 @@ class GameLoop:
         self.total_time = 0.0
         self.delta_time = 0.0
         self.physics_accumulator = 0.0
-        self._frame_times = []
-        self._last_time = time.perf_counter()
+        self._frame_times = deque(maxlen=self.config.fps_sample_size)
+        self._frame_time_sum = 0.0
+        self._sample_count = 0
+        self._min_window = deque()
+        self._max_window = deque()
+        self._last_time_ns = _perf_counter_ns()
+        self._target_frame_ns = self.config.target_frame_ns
+        self._max_fixed_updates = self.config.max_fixed_updates
+        self._next_deadline_ns = self._last_time_ns + self._target_frame_ns
         self._metrics = PerformanceMetrics()
 
     def stop(self) -> None:
@@ -98,92 +169,138 @@ class GameLoop:
 
     def run_one_frame(self) -> None:
         """Process a single frame."""
-        frame_start = time.perf_counter()
-        self._process_frame()
-
-        # Calculate sleep time to maintain target FPS
-        frame_time = time.perf_counter() - frame_start
-        target_frame_time = 1.0 / self.config.fps
-        sleep_time = max(0.0, target_frame_time - frame_time)
-
-        if sleep_time > 0:
-            time.sleep(sleep_time)
-            self._metrics.idle_time = sleep_time
-
-    def _process_frame(self) -> None:
-        """Process a single frame of the game loop."""
-        current_time = time.perf_counter()
-        frame_time = current_time - self._last_time
-        self._last_time = current_time
+        now_ns = self._process_frame()
+
+        # Wait until the absolute deadline of this frame. Deadlines advance by
+        # a fixed step rather than being measured from "now", so oversleeping
+        # in one frame is paid back in the next instead of accumulating drift.
+        target_frame_ns = self._target_frame_ns
+        deadline_ns = self._next_deadline_ns
+        remaining_ns = deadline_ns - now_ns
+
+        if remaining_ns > 0:
+            if remaining_ns > 2 * _SPIN_THRESHOLD_NS:
+                time.sleep((remaining_ns - _SPIN_THRESHOLD_NS) / _NS_PER_SECOND)
+            perf_counter_ns = _perf_counter_ns
+            while perf_counter_ns() < deadline_ns:
+                pass
+            self._metrics.idle_time = remaining_ns / _NS_PER_SECOND
+            self._next_deadline_ns = deadline_ns + target_frame_ns
+        elif -remaining_ns > self.config.max_frame_time_ns:
+            # Too far behind to catch up; restart the schedule from now
+            self._next_deadline_ns = now_ns + target_frame_ns
+        else:
+            self._next_deadline_ns = deadline_ns + target_frame_ns
+
+    def _process_frame(self) -> int:
+        """Process a single frame of the game loop.
+
+        Returns:
+            Timestamp in nanoseconds at the end of the frame's work
+        """
+        config = self.config
+        update_func = self.update_func
+        current_time_ns = _perf_counter_ns()
+        frame_time = (current_time_ns - self._last_time_ns) / _NS_PER_SECOND
+        self._last_time_ns = current_time_ns
 
         # Clamp frame time
-        frame_time = min(frame_time, self.config.max_frame_time)
+        if frame_time > config.max_frame_time:
+            frame_time = config.max_frame_time
         self.delta_time = frame_time
         self.total_time += frame_time
         self.frame_count += 1
 
-        # Fixed timestep updates
-        self._start_timing("fixed_update_time")
-        self.physics_accumulator += frame_time
-        fixed_updates = 0
-        while self.physics_accumulator >= self.config.fixed_time_step:
-            self.update_func(self.config.fixed_time_step)
-            self.physics_accumulator -= self.config.fixed_time_step
-            fixed_updates += 1
-        self._end_timing("fixed_update_time")
+        # Fixed timestep updates. Each section starts where the previous one
+        # ended, so one clock read per section is enough, and none is needed
+        # for the fixed section when no step is due.
+        metrics = self._metrics
+        fixed_time_step = config.fixed_time_step
+        accumulator = self.physics_accumulator + frame_time
+        fixed_updates = int(accumulator // fixed_time_step)
+        max_fixed_updates = self._max_fixed_updates
+        if fixed_updates > max_fixed_updates:
+            # Drop the backlog rather than spiralling into ever longer frames
+            metrics.dropped_fixed_steps += fixed_updates - max_fixed_updates
+            fixed_updates = max_fixed_updates
+            accumulator %= fixed_time_step
+        else:
+            accumulator -= fixed_updates * fixed_time_step
+        self.physics_accumulator = accumulator
+        if fixed_updates:
+            for _ in range(fixed_updates):
+                update_func(fixed_time_step)
+            fixed_end_ns = _perf_counter_ns()
+        else:
+            fixed_end_ns = current_time_ns
+        metrics.fixed_update_time = _smoothed(
+            metrics.fixed_update_time, fixed_end_ns - current_time_ns
+        )
 
         # Always do variable timestep update
-        self._start_timing("update_time")
-        self.update_func(frame_time)
-        self._end_timing("update_time")
+        update_func(frame_time)
+        update_end_ns = _perf_counter_ns()
+        metrics.update_time = _smoothed(
+            metrics.update_time, update_end_ns - fixed_end_ns
+        )
 
         # Render
-        self._start_timing("render_time")
         self.render_func()
-        self._end_timing("render_time")
+        render_end_ns = _perf_counter_ns()
+        metrics.render_time = _smoothed(
+            metrics.render_time, render_end_ns - update_end_ns
+        )
 
         # Update metrics
-        self._frame_times.append(frame_time)
-        if len(self._frame_times) > self.config.fps_sample_size:
-            self._frame_times.pop(0)
+        self._record_frame_time(frame_time)
         self._update_metrics()
-
-    def _start_timing(self, metric_name: str) -> None:
-        """Start timing a section of the game loop."""
-        start_time = time.perf_counter()
-        self._timing_stack.append((metric_name, start_time))
-
-    def _end_timing(self, metric_name: str) -> None:
-        """End timing a section and update the corresponding metric."""
-        if not self._timing_stack:
-            return
-
-        name, start_time = self._timing_stack.pop()
-        if name != metric_name:
-            return
-
-        duration = time.perf_counter() - start_time
-        # Use exponential moving average for smoother metrics
-        alpha = 0.2  # Smoothing factor
-        current_value = getattr(self._metrics, metric_name)
-        new_value = (alpha * duration) + ((1 - alpha) * current_value)
-        setattr(self._metrics, metric_name, new_value)
+        return render_end_ns
+
+    def _record_frame_time(self, frame_time: float) -> None:
+        """Add a frame time to the history and its running statistics.
+
+        Args:
+            frame_time: Duration of the frame in seconds
+        """
+        # The deque evicts the oldest sample on its own, so the running sum
+        # only needs to drop it before the append
+        frame_times = self._frame_times
+        if len(frame_times) == frame_times.maxlen:
+            self._frame_time_sum -= frame_times[0]
+        frame_times.append(frame_time)
+        self._frame_time_sum += frame_time
+
+        sample = self._sample_count
+        self._sample_count = sample + 1
+        oldest = sample - len(frame_times)  # Last sample number out of the window
+
+        min_window = self._min_window
+        while min_window and min_window[-1][1] >= frame_time:
+            min_window.pop()
+        min_window.append((sample, frame_time))
+        if min_window[0][0] <= oldest:
+            min_window.popleft()
+
+        max_window = self._max_window
+        while max_window and max_window[-1][1] <= frame_time:
+            max_window.pop()
+        max_window.append((sample, frame_time))
+        if max_window[0][0] <= oldest:
+            max_window.popleft()
 
     def _update_metrics(self) -> None:
         """Update performance metrics."""
-        if not self._frame_times:
+        frame_times = self._frame_times
+        if not frame_times:
             return
 
-        current_frame_time = self._frame_times[-1]
-        self._metrics.frame_time = current_frame_time
-        self._metrics.min_frame_time = min(self._frame_times)
-        self._metrics.max_frame_time = max(self._frame_times)
-        self._metrics.avg_frame_time = sum(self._frame_times) / len(self._frame_times)
-        self._metrics.fps = (
-            1.0 / self._metrics.avg_frame_time
-            if self._metrics.avg_frame_time > 0
-            else 0.0
-        )
+        metrics = self._metrics
+        metrics.frame_time = frame_times[-1]
+        metrics.min_frame_time = self._min_window[0][1]
+        metrics.max_frame_time = self._max_window[0][1]
+        avg_frame_time = self._frame_time_sum / len(frame_times)
+        metrics.avg_frame_time = avg_frame_time
+        metrics.fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0.0
 
     @property
     def average_fps(self) -> float:
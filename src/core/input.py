@@ -6,9 +6,13 @@ input buffering, and state tracking for both keyboard and mouse input.
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List, Optional, Set
 
 import pygame
+from pygame import KEYDOWN as _KEYDOWN
+from pygame import KEYUP as _KEYUP
+
+from ._compat import DATACLASS_SLOTS
 
 
 class InputState(Enum):
@@ -20,7 +24,7 @@ class InputState(Enum):
     RELEASED = auto()  # Just released this frame
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InputAction:
     """Configuration for an input action."""
 
@@ -28,7 +32,7 @@ class InputAction:
     buffer_time: float = 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InputBinding:
     """Configuration for an input binding."""
 
@@ -37,19 +41,41 @@ class InputBinding:
 
 
 class InputManager:
-    """Manages input state and bindings."""
+    """Manages input state and bindings.
+
+    Each registered action owns one bit, and the pressed, held and released
+    states are integer bitmasks over those bits, so a state query is a single
+    AND and clearing the per-frame states is an assignment.
+    """
 
     def __init__(self) -> None:
         """Initialize the input manager."""
         self._bindings: Dict[str, Set[int]] = {}  # Action -> Set of keys
         self._key_to_action: Dict[int, str] = {}  # Key -> Action
-        self._pressed: Set[str] = set()  # Actions pressed this frame
-        self._held: Set[str] = set()  # Actions being held
-        self._released: Set[str] = set()  # Actions released this frame
+        self._action_masks: Dict[str, int] = {}  # Action -> Its state bit
+        self._pressed = 0  # Bits of actions pressed this frame
+        self._held = 0  # Bits of actions being held
+        self._released = 0  # Bits of actions released this frame
         self._buffer_times: Dict[str, float] = {}  # Action -> Buffer time remaining
         self._buffer_durations: Dict[str, float] = {}  # Action -> Buffer duration
         self._last_update_time: float = time.perf_counter()
 
+    def reset(self) -> None:
+        """Remove every action and binding and clear all input state.
+
+        Leaves the manager as if newly constructed, without reallocating its
+        tables.
+        """
+        self._bindings.clear()
+        self._key_to_action.clear()
+        self._action_masks.clear()
+        self._pressed = 0
+        self._held = 0
+        self._released = 0
+        self._buffer_times.clear()
+        self._buffer_durations.clear()
+        self._last_update_time = time.perf_counter()
+
     def register_action(self, action: str, buffer_time: float = 0.0) -> None:
         """Register a new action.
 
@@ -63,6 +89,7 @@ class InputManager:
         if action in self._bindings:
             raise ValueError(f"Action '{action}' already exists")
         self._bindings[action] = set()
+        self._action_masks[action] = 1 << len(self._action_masks)
         if buffer_time > 0:
             self._buffer_durations[action] = buffer_time
 
@@ -129,37 +156,78 @@ class InputManager:
         Args:
             event: Pygame event to process
         """
-        if event.type == pygame.KEYDOWN:
-            if event.key in self._key_to_action:
-                action = self._key_to_action[event.key]
-                if action not in self._held:  # Only mark as pressed if not already held
-                    self._pressed.add(action)
-                self._held.add(action)
-                if action in self._buffer_durations:
-                    self._buffer_times[action] = self._buffer_durations[action]
-
-        elif event.type == pygame.KEYUP:
-            if event.key in self._key_to_action:
-                action = self._key_to_action[event.key]
-                if action in self._held:  # Only mark as released if was held
-                    self._released.add(action)
-                self._held.discard(action)
-
-    def update(self) -> None:
-        """Update input state for this frame."""
+        self.process_events((event,))
+
+    def process_events(self, events: Iterable[pygame.event.Event]) -> None:
+        """Process a batch of input events, such as one frame's event queue.
+
+        Events are applied in order, so a key released and pressed again
+        within the batch ends up held. The state lookups are bound once for
+        the whole batch rather than once per event.
+
+        Args:
+            events: Pygame events to process; non-key events are ignored
+        """
+        key_to_action = self._key_to_action
+        action_masks = self._action_masks
+        pressed = self._pressed
+        held = self._held
+        released = self._released
+        buffer_durations = self._buffer_durations
+        buffer_times = self._buffer_times
+
+        for event in events:
+            event_type = event.type
+            if event_type == _KEYDOWN:
+                action = key_to_action.get(event.key)
+                if action is not None:
+                    mask = action_masks[action]
+                    if not held & mask:  # Only mark as pressed if not held
+                        pressed |= mask
+                        held |= mask
+                    buffer_duration = buffer_durations.get(action)
+                    if buffer_duration is not None:
+                        buffer_times[action] = buffer_duration
+
+            elif event_type == _KEYUP:
+                action = key_to_action.get(event.key)
+                if action is not None:
+                    mask = action_masks[action]
+                    if held & mask:  # Only mark as released if was held
+                        released |= mask
+                        held &= ~mask
+
+        self._pressed = pressed
+        self._held = held
+        self._released = released
+
+    def update(self, dt: Optional[float] = None) -> None:
+        """Update input state for this frame.
+
+        Args:
+            dt: Time elapsed since the last update in seconds. If omitted, it
+                is measured from the wall clock.
+        """
         current_time = time.perf_counter()
-        dt = current_time - self._last_update_time
+        if dt is None:
+            dt = current_time - self._last_update_time
         self._last_update_time = current_time
 
         # Update buffer times
-        for action in list(self._buffer_times.keys()):
-            self._buffer_times[action] -= dt
-            if self._buffer_times[action] <= 0:
+        if self._buffer_times:
+            expired = []
+            for action, remaining in self._buffer_times.items():
+                remaining -= dt
+                if remaining <= 0:
+                    expired.append(action)
+                else:
+                    self._buffer_times[action] = remaining
+            for action in expired:
                 del self._buffer_times[action]
 
         # Clear one-frame states
-        self._pressed.clear()
-        self._released.clear()
+        self._pressed = 0
+        self._released = 0
 
     def is_pressed(self, action: str) -> bool:
         """Check if an action was pressed this frame.
@@ -170,9 +238,10 @@ class InputManager:
         Returns:
             True if the action was pressed this frame
         """
-        if action not in self._bindings:
+        mask = self._action_masks.get(action)
+        if mask is None:
             raise ValueError(f"Action '{action}' not registered")
-        return action in self._pressed
+        return bool(self._pressed & mask)
 
     def is_held(self, action: str) -> bool:
         """Check if an action is being held.
@@ -183,9 +252,10 @@ class InputManager:
         Returns:
             True if the action is being held
         """
-        if action not in self._bindings:
+        mask = self._action_masks.get(action)
+        if mask is None:
             raise ValueError(f"Action '{action}' not registered")
-        return action in self._held
+        return bool(self._held & mask)
 
     def is_released(self, action: str) -> bool:
         """Check if an action was released this frame.
@@ -196,9 +266,10 @@ class InputManager:
         Returns:
             True if the action was released this frame
         """
-        if action not in self._bindings:
+        mask = self._action_masks.get(action)
+        if mask is None:
             raise ValueError(f"Action '{action}' not registered")
-        return action in self._released
+        return bool(self._released & mask)
 
     def is_buffered(self, action: str) -> bool:
         """Check if an action is in the input buffer.
@@ -39,6 +39,24 @@ class PhysicsBody:
         self.state = PhysicsState()
         self.collision_rect = pygame.Rect(0, 0, 32, 32)  # Default size
 
+    def reset(self, x: float = 0.0, y: float = 0.0) -> None:
+        """Put the body at rest at a position, e.g. on respawn.
+
+        The state object is kept, but its vectors are replaced rather than
+        mutated, since callers may share them.
+
+        Args:
+            x: New x position
+            y: New y position
+        """
+        state = self.state
+        state.position = Vector2D(x, y)
+        state.velocity = Vector2D()
+        state.acceleration = Vector2D()
+        state.grounded = False
+        self.collision_rect.x = int(x)
+        self.collision_rect.y = int(y)
+
     def apply_force(self, force: Vector2D) -> None:
         """Apply a force to the body.
 
@@ -67,38 +85,42 @@ class PhysicsBody:
         Args:
             dt: Time step in seconds
         """
-        # Store initial velocity for position update
-        initial_velocity = Vector2D(self.state.velocity.x, self.state.velocity.y)
+        # Integrate on plain floats; only the final state allocates vectors
+        state = self.state
+        config = self.config
+        initial_vx = state.velocity.x
+        initial_vy = state.velocity.y
 
-        # Apply gravity
-        self.state.acceleration += self.config.gravity
-
-        # Update velocity with acceleration
-        self.state.velocity += self.state.acceleration * dt
+        # Apply gravity and update velocity with acceleration
+        vx = initial_vx + (state.acceleration.x + config.gravity.x) * dt
+        vy = initial_vy + (state.acceleration.y + config.gravity.y) * dt
 
         # Apply friction if grounded
-        if self.state.grounded:
-            friction = Vector2D(self.state.velocity.x * -self.config.friction, 0)
-            self.state.velocity += friction * dt
+        if state.grounded:
+            vx += vx * -config.friction * dt
 
         # Clamp velocity to maximum
-        self.state.velocity = Vector2D(
-            min(abs(self.state.velocity.x), self.config.max_velocity.x)
-            * (1 if self.state.velocity.x > 0 else -1),
-            min(abs(self.state.velocity.y), self.config.max_velocity.y)
-            * (1 if self.state.velocity.y > 0 else -1),
-        )
+        max_vx = config.max_velocity.x
+        max_vy = config.max_velocity.y
+        if abs(vx) > max_vx:
+            vx = max_vx if vx > 0 else -max_vx
+        if abs(vy) > max_vy:
+            vy = max_vy if vy > 0 else -max_vy
+        state.velocity = Vector2D(vx, vy)
 
         # Update position using average velocity
-        average_velocity = (initial_velocity + self.state.velocity) * 0.5
-        self.state.position += average_velocity * dt
+        half_dt = 0.5 * dt
+        state.position = Vector2D(
+            state.position.x + (initial_vx + vx) * half_dt,
+            state.position.y + (initial_vy + vy) * half_dt,
+        )
 
         # Update collision rect position
-        self.collision_rect.x = int(self.state.position.x)
-        self.collision_rect.y = int(self.state.position.y)
+        self.collision_rect.x = int(state.position.x)
+        self.collision_rect.y = int(state.position.y)
 
         # Reset acceleration (forces are accumulated each frame)
-        self.state.acceleration = Vector2D()
+        state.acceleration = Vector2D()
 
     def handle_collision(self, normal: Vector2D, penetration: float) -> None:
         """Handle collision response.
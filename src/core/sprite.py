@@ -43,9 +43,31 @@ class SpriteSheet:
             FileNotFoundError: If texture file doesn't exist
             pygame.error: If texture file is invalid
         """
-        self.texture = pygame.image.load(texture_path).convert_alpha()
+        self._init_from_texture(pygame.image.load(texture_path))
+
+    def _init_from_texture(self, surface: pygame.Surface) -> None:
+        """Set up the sheet's state; shared by every constructor.
+
+        Args:
+            surface: Image to use as the sprite sheet texture
+        """
+        self.texture = surface.convert_alpha()
         self.frames: List[SpriteFrame] = []
 
+    @classmethod
+    def from_surface(cls, surface: pygame.Surface) -> "SpriteSheet":
+        """Create a sprite sheet from an already loaded surface.
+
+        Args:
+            surface: Image to use as the sprite sheet texture
+
+        Returns:
+            New sprite sheet with no frames
+        """
+        sheet = cls.__new__(cls)
+        sheet._init_from_texture(surface)
+        return sheet
+
     def add_frame(self, frame: SpriteFrame) -> int:
         """Add a frame to the sprite sheet.
 
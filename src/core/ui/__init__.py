@@ -1,6 +1,14 @@
 """UI system for the game engine."""
 from src.core.ui.button import Button, ButtonStyle
 from src.core.ui.text import Text, TextConfig
-from src.core.ui.ui_element import UIElement, UIRect
+from src.core.ui.ui_element import UIElement, UIRect, set_screen_rect
 
-__all__ = ["UIElement", "UIRect", "Text", "TextConfig", "Button", "ButtonStyle"]
+__all__ = [
+    "UIElement",
+    "UIRect",
+    "Text",
+    "TextConfig",
+    "Button",
+    "ButtonStyle",
+    "set_screen_rect",
+]
@@ -1,17 +1,43 @@
 """Button UI element with text and interaction states."""
-from dataclasses import dataclass
-from typing import Callable, Optional, Tuple, cast
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
 
 import pygame
+from pygame import MOUSEBUTTONDOWN as _MOUSEBUTTONDOWN
+from pygame import MOUSEBUTTONUP as _MOUSEBUTTONUP
+from pygame import MOUSEMOTION as _MOUSEMOTION
 
+from src.core._compat import DATACLASS_SLOTS
 from src.core.ui.text import Text, TextConfig
-from src.core.ui.ui_element import UIElement, UIRect
+from src.core.ui.ui_element import POINTER_EVENTS, UIElement, UIRect
 
+# Background color, border color, border width and corner radius for one state
+_ButtonLook = Tuple[Tuple[int, int, int], Optional[Tuple[int, int, int]], int, int]
 
-@dataclass
+
+def _color_tuple(color: Any) -> Tuple[int, ...]:
+    """Convert a color to a plain tuple so it can be part of a cache key.
+
+    Args:
+        color: Color as a tuple, list, pygame.Color or color name
+
+    Returns:
+        The color's components as a tuple
+    """
+    if isinstance(color, str):
+        color = pygame.Color(color)
+    return tuple(color)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ButtonStyle:
     """Visual style configuration for buttons.
 
+    Styles are immutable so that the per-state looks used for rendering can
+    be computed once when the style is created. Colors may be given as any
+    pygame color value; they are stored as tuples.
+
     Attributes:
         background_color: Normal state background color
         hover_color: Background color when mouse is over button
@@ -31,6 +57,64 @@ class ButtonStyle:
     corner_radius: int = 0
     padding: Tuple[int, int, int, int] = (0, 0, 0, 0)
     text_config: Optional[TextConfig] = None
+    _looks: Tuple[_ButtonLook, _ButtonLook, _ButtonLook] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Normalize the colors and precompute the normal, hover and pressed looks."""
+        for name in ("background_color", "hover_color", "pressed_color"):
+            object.__setattr__(self, name, _color_tuple(getattr(self, name)))
+        if self.border_color is not None:
+            object.__setattr__(self, "border_color", _color_tuple(self.border_color))
+        has_border = bool(self.border_color) and self.border_width > 0
+        border_color = self.border_color if has_border else None
+        border_width = self.border_width if has_border else 0
+        looks = tuple(
+            (color, border_color, border_width, self.corner_radius)
+            for color in (
+                self.background_color,
+                self.hover_color,
+                self.pressed_color,
+            )
+        )
+        object.__setattr__(self, "_looks", looks)
+
+
+@lru_cache(maxsize=256)
+def _make_button_surface(
+    width: int,
+    height: int,
+    color: Tuple[int, int, int],
+    border_color: Optional[Tuple[int, int, int]],
+    border_width: int,
+    corner_radius: int,
+) -> pygame.Surface:
+    """Render a button background, shared by all buttons with the same look.
+
+    Args:
+        width: Width of the button in pixels
+        height: Height of the button in pixels
+        color: Background color
+        border_color: Border color, or None for no border
+        border_width: Width of the border in pixels
+        corner_radius: Radius for rounded corners (0 for square)
+
+    Returns:
+        Surface with the rendered background
+    """
+    background = pygame.Surface((width, height), pygame.SRCALPHA)
+    rect = background.get_rect()
+    pygame.draw.rect(background, color, rect, border_radius=corner_radius)
+    if border_color and border_width > 0:
+        pygame.draw.rect(
+            background,
+            border_color,
+            rect,
+            border_width,
+            border_radius=corner_radius,
+        )
+    return background
 
 
 class Button(UIElement):
@@ -51,6 +135,8 @@ class Button(UIElement):
         self._pressed = False
         self._on_click: Optional[Callable[[], None]] = None
         self._last_mouse_pos = (0, 0)
+        self._text_bounds: Optional[pygame.Rect] = None
+        self._text_bounds_version = -1
 
         # Create text element
         text_rect = UIRect(
@@ -105,25 +191,23 @@ class Button(UIElement):
         Returns:
             True if the event was handled, False otherwise
         """
-        if not self.enabled or not self.visible:
+        event_type = event.type
+        if event_type not in POINTER_EVENTS or not self._enabled or not self._visible:
             return False
 
-        if hasattr(event, "pos"):
-            self._last_mouse_pos = event.pos
-
-        bounds = self.get_bounds()
-        mouse_over = bounds.collidepoint(self._last_mouse_pos)
+        mouse_pos = self._last_mouse_pos = event.pos
+        mouse_over = self._fast_contains(mouse_pos[0], mouse_pos[1])
 
-        if event.type == pygame.MOUSEMOTION:
+        if event_type == _MOUSEMOTION:
             was_hovered = self._hovered
             self._hovered = mouse_over
             return was_hovered != self._hovered
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        elif event_type == _MOUSEBUTTONDOWN and event.button == 1:
             if mouse_over:
                 self._hovered = True
                 self._pressed = True
                 return True
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+        elif event_type == _MOUSEBUTTONUP and event.button == 1:
             was_pressed = self._pressed
             self._pressed = False
             if was_pressed and mouse_over and self._on_click is not None:
@@ -141,42 +225,61 @@ class Button(UIElement):
         if not self.visible:
             return
 
-        # Get current color based on state
-        color = self.style.background_color
+        # Get current look based on state
+        looks = self.style._looks
         if self._pressed:
-            color = self.style.pressed_color
+            look = looks[2]
         elif self._hovered:
-            color = self.style.hover_color
-
-        # Draw background
-        rect = pygame.Rect(
-            self.screen_rect.x,
-            self.screen_rect.y,
-            self.screen_rect.width,
-            self.screen_rect.height,
-        )
-        if self.style.corner_radius > 0:
-            pygame.draw.rect(
-                surface,
+            look = looks[1]
+        else:
+            look = looks[0]
+        color, border_color, border_width, corner_radius = look
+
+        # Draw background. Plain square buttons are a single fill; anything
+        # with rounded corners or a border is rendered once per distinct look
+        # and blitted from the cache.
+        rect = self.screen_rect
+        if corner_radius > 0 or border_width > 0:
+            background = _make_button_surface(
+                rect.width,
+                rect.height,
                 color,
-                rect,
-                border_radius=self.style.corner_radius,
+                border_color,
+                border_width,
+                corner_radius,
             )
+            surface.blit(background, rect)
         else:
-            pygame.draw.rect(surface, color, rect)
-
-        # Draw border
-        if self.style.border_color and self.style.border_width > 0:
-            pygame.draw.rect(
-                surface,
-                self.style.border_color,
-                rect,
-                self.style.border_width,
-                border_radius=self.style.corner_radius,
-            )
+            surface.fill(color, rect)
+
+        # Render text inside the padded area, then any other children
+        self.text_element.render(surface, self._get_text_bounds())
+        for child in self._children:
+            if child is not self.text_element:
+                child.render(surface)
 
-        # Render text
-        super().render(surface)
+    def _get_text_bounds(self) -> pygame.Rect:
+        """Get the padded area the text is drawn in.
+
+        Recomputed only when the button's screen rect changes.
+
+        Returns:
+            Text area in screen coordinates
+        """
+        rect = self.screen_rect
+        if (
+            self._text_bounds is None
+            or self._text_bounds_version != self._bounds_version
+        ):
+            left, top, right, bottom = self.style.padding
+            self._text_bounds = pygame.Rect(
+                rect.x + left,
+                rect.y + top,
+                rect.width - left - right,
+                rect.height - top - bottom,
+            )
+            self._text_bounds_version = self._bounds_version
+        return self._text_bounds
 
     def update(self, dt: float) -> None:
         """Update button state.
@@ -184,40 +287,13 @@ class Button(UIElement):
         Args:
             dt: Time delta in seconds
         """
+        # Update text element state; the text itself is updated as a child
+        self.text_element.enabled = self._enabled
+        self.text_element.visible = self._visible
         super().update(dt)
 
-        # Update text element state
-        self.text_element.enabled = self.enabled
-        self.text_element.visible = self.visible
-        self.text_element.update(dt)
-
-        # Reset hover state if button is disabled or invisible
-        if not self.enabled or not self.visible:
+        # Hover and press state is driven by handle_event. Disabled or hidden
+        # buttons ignore events, so clear any state left from before.
+        if not self._enabled or not self._visible:
             self._hovered = False
             self._pressed = False
-            return
-
-        # Update hover state based on last known mouse position
-        bounds = self.get_bounds()
-        self._hovered = bounds.collidepoint(self._last_mouse_pos)
-
-        # If mouse is not hovering, button can't be pressed
-        if not self._hovered:
-            self._pressed = False
-
-    def get_bounds(self, parent_bounds: Optional[pygame.Rect] = None) -> pygame.Rect:
-        """Calculate the button's screen-space bounds.
-
-        Args:
-            parent_bounds: Parent element's bounds (for percentage calculations)
-
-        Returns:
-            Button's bounds in screen coordinates
-        """
-        bounds = super().get_bounds(parent_bounds)
-        return pygame.Rect(
-            bounds.x,
-            bounds.y,
-            bounds.width,
-            bounds.height,
-        )
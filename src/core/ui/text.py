@@ -170,11 +170,15 @@ class Text(UIElement):
 
         return combined
 
-    def render(self, surface: pygame.Surface) -> None:
+    def render(
+        self, surface: pygame.Surface, bounds: Optional[pygame.Rect] = None
+    ) -> None:
         """Render the text element.
 
         Args:
             surface: Surface to render to
+            bounds: Area to align the text in, if already known by the caller.
+                Defaults to the element's own bounds.
         """
         if not self.visible or not self.text:
             return
@@ -189,7 +193,8 @@ class Text(UIElement):
             return
 
         # Get bounds and handle alignment
-        bounds = self.get_bounds()
+        if bounds is None:
+            bounds = self.get_bounds()
         if self.config.align == "center":
             x = bounds.x + (bounds.width - self._surface.get_width()) // 2
         elif self.config.align == "right":
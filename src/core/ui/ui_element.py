@@ -4,8 +4,32 @@ from typing import List, Optional, Tuple
 
 import pygame
 
+from src.core._compat import DATACLASS_SLOTS
 
-@dataclass
+# Event types carrying a ``pos``; UI elements ignore everything else
+POINTER_EVENTS = frozenset(
+    (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+)
+
+# Screen bounds used for root elements, set through set_screen_rect()
+_screen_rect_cache: Optional[pygame.Rect] = None
+
+
+def set_screen_rect(rect: Optional[pygame.Rect]) -> None:
+    """Set the screen bounds that root UI elements are laid out against.
+
+    Without this, root elements query the display surface every time their
+    bounds are requested. Call it once the display is created and again on
+    ``pygame.VIDEORESIZE``; pass None to go back to querying the display.
+
+    Args:
+        rect: Screen bounds, or None to use the current display surface
+    """
+    global _screen_rect_cache  # pylint: disable=global-statement
+    _screen_rect_cache = pygame.Rect(rect) if rect is not None else None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class UIRect:
     """Rectangle defining UI element bounds and anchor points.
 
@@ -34,13 +58,27 @@ class UIElement:
     child elements.
     """
 
+    __slots__ = (
+        "_rect",
+        "_parent",
+        "_children",
+        "_visible",
+        "_enabled",
+        "_z_index",
+        "_cached_bounds",
+        "_screen_rect",
+        "_last_parent_bounds",
+        "_bounds_version",
+        "_last_parent_version",
+    )
+
     def __init__(self, rect: Optional[UIRect] = None) -> None:
         """Initialize the UI element.
 
         Args:
             rect: Rectangle defining element bounds and anchors
         """
-        self.rect = rect or UIRect()
+        self._rect = rect or UIRect()
         self._parent: Optional[UIElement] = None
         self._children: List[UIElement] = []
         self._visible = True
@@ -48,6 +86,32 @@ class UIElement:
         self._z_index = 0
         self._cached_bounds: Optional[pygame.Rect] = None
         self._screen_rect: Optional[pygame.Rect] = None
+        self._last_parent_bounds: Optional[pygame.Rect] = None
+        # Bumped whenever this element's screen rect changes, so children can
+        # validate their cached rects with an integer compare
+        self._bounds_version = 0
+        self._last_parent_version = -1
+
+    @property
+    def rect(self) -> UIRect:
+        """Get the rectangle defining element bounds and anchors."""
+        return self._rect
+
+    @rect.setter
+    def rect(self, value: UIRect) -> None:
+        """Set the rectangle defining element bounds and anchors.
+
+        Args:
+            value: New rectangle
+        """
+        self._rect = value
+        self._invalidate_bounds()
+
+    def _invalidate_bounds(self) -> None:
+        """Drop cached bounds so they are recomputed on next access."""
+        self._cached_bounds = None
+        self._screen_rect = None
+        self._bounds_version += 1
 
     @property
     def parent(self) -> Optional["UIElement"]:
@@ -65,9 +129,23 @@ class UIElement:
             self._parent._children.remove(self)
         self._parent = value
         if value:
-            value._children.append(self)
-        self._cached_bounds = None
-        self._screen_rect = None
+            value._insert_child(self)
+        self._invalidate_bounds()
+
+    def _insert_child(self, child: "UIElement") -> None:
+        """Insert a child, keeping children ordered by z-index.
+
+        Children with equal z-index keep their insertion order, so the list
+        can be iterated directly for rendering and in reverse for events.
+
+        Args:
+            child: Element to insert
+        """
+        children = self._children
+        index = len(children)
+        while index > 0 and children[index - 1]._z_index > child._z_index:
+            index -= 1
+        children.insert(index, child)
 
     @property
     def visible(self) -> bool:
@@ -109,7 +187,12 @@ class UIElement:
         Args:
             value: New z-index value
         """
+        if value == self._z_index:
+            return
         self._z_index = value
+        if self._parent:
+            self._parent._children.remove(self)
+            self._parent._insert_child(self)
 
     @property
     def screen_rect(self) -> pygame.Rect:
@@ -118,6 +201,15 @@ class UIElement:
         Returns:
             Rectangle in screen coordinates
         """
+        parent = self._parent
+        parent_rect: Optional[pygame.Rect] = None
+        if parent is not None:
+            # Accessing the parent's rect revalidates the whole ancestor chain;
+            # a version mismatch means it moved since we were last computed
+            parent_rect = parent.screen_rect
+            if parent._bounds_version != self._last_parent_version:
+                self._screen_rect = None
+
         if self._screen_rect is None:
             # Calculate screen position
             x = self.rect.x
@@ -126,8 +218,7 @@ class UIElement:
             height = self.rect.height
 
             # Convert percentages to pixels
-            if self.parent:
-                parent_rect = self.parent.screen_rect
+            if parent_rect is not None:
                 if isinstance(x, float) and 0.0 <= x <= 1.0:
                     x = parent_rect.width * x
                 if isinstance(y, float) and 0.0 <= y <= 1.0:
@@ -142,12 +233,15 @@ class UIElement:
             y -= height * self.rect.anchor_y
 
             # Add parent offset
-            if self.parent:
-                parent_rect = self.parent.screen_rect
+            if parent_rect is not None:
                 x += parent_rect.x
                 y += parent_rect.y
 
             self._screen_rect = pygame.Rect(int(x), int(y), int(width), int(height))
+            self._bounds_version += 1
+            self._last_parent_version = (
+                parent._bounds_version if parent is not None else -1
+            )
 
         return self._screen_rect
 
@@ -179,42 +273,40 @@ class UIElement:
         """
         if not parent_bounds:
             # Use screen bounds if no parent
-            display = pygame.display.get_surface()
-            if display:
-                parent_bounds = display.get_rect()
-            else:
-                # Fallback to default size if no display
-                parent_bounds = pygame.Rect(0, 0, 800, 600)
+            parent_bounds = _screen_rect_cache
+            if parent_bounds is None:
+                display = pygame.display.get_surface()
+                if display:
+                    parent_bounds = display.get_rect()
+                else:
+                    # Fallback to default size if no display
+                    parent_bounds = pygame.Rect(0, 0, 800, 600)
 
         # Return cached bounds if parent hasn't changed
-        if self._cached_bounds and parent_bounds == getattr(
-            self, "_last_parent_bounds", None
-        ):
+        if self._cached_bounds and parent_bounds == self._last_parent_bounds:
             return self._cached_bounds
 
         # Calculate position based on parent bounds
-        x = self.rect.x
-        y = self.rect.y
-        width = self.rect.width
-        height = self.rect.height
+        rect = self._rect
+        x = rect.x
+        y = rect.y
+        width = rect.width
+        height = rect.height
+        parent_x, parent_y, parent_width, parent_height = parent_bounds
 
         # Convert percentages to pixels
         if 0 <= x <= 1:
-            x = parent_bounds.width * x
+            x = parent_width * x
         if 0 <= y <= 1:
-            y = parent_bounds.height * y
+            y = parent_height * y
         if 0 <= width <= 1:
-            width = parent_bounds.width * width
+            width = parent_width * width
         if 0 <= height <= 1:
-            height = parent_bounds.height * height
-
-        # Apply anchoring
-        x -= width * self.rect.anchor_x
-        y -= height * self.rect.anchor_y
+            height = parent_height * height
 
-        # Add parent offset
-        x += parent_bounds.x
-        y += parent_bounds.y
+        # Apply anchoring and add parent offset
+        x += parent_x - width * rect.anchor_x
+        y += parent_y - height * rect.anchor_y
 
         # Cache result
         self._cached_bounds = pygame.Rect(int(x), int(y), int(width), int(height))
@@ -231,12 +323,25 @@ class UIElement:
         Returns:
             bool: True if the point is within the element's bounds, False otherwise.
         """
-        if not self.visible:
+        if not self._visible:
             return False
 
-        x, y = point
+        return self._fast_contains(point[0], point[1])
+
+    def _fast_contains(self, x: float, y: float) -> bool:
+        """Check if a point is within the element's bounds, ignoring visibility.
+
+        Args:
+            x: X coordinate of the point
+            y: Y coordinate of the point
+
+        Returns:
+            True if the point is within the element's bounds
+        """
         bounds = self.get_bounds()
-        return bool(bounds.collidepoint(int(x), int(y)))
+        left = bounds.x
+        top = bounds.y
+        return left <= x < left + bounds.width and top <= y < top + bounds.height
 
     def update(self, dt: float) -> None:
         """Update the element.
@@ -260,11 +365,8 @@ class UIElement:
         if not self._visible:
             return
 
-        # Get sorted children by z-index
-        sorted_children = sorted(self._children, key=lambda c: c.z_index)
-
-        # Render children
-        for child in sorted_children:
+        # Render children; they are kept sorted by z-index
+        for child in self._children:
             child.render(surface)
 
     def handle_event(self, event: pygame.event.Event) -> bool:
@@ -276,16 +378,17 @@ class UIElement:
         Returns:
             bool: True if the event was handled, False otherwise.
         """
-        if not self.enabled or not self.visible:
+        if event.type not in POINTER_EVENTS or not self._enabled or not self._visible:
             return False
 
-        # Check if event is within bounds for mouse events
-        if hasattr(event, "pos") and self.contains_point(event.pos):
+        # Check if event is within bounds. Visibility was checked above, so
+        # the bounds test can skip contains_point().
+        pos = event.pos
+        if self._fast_contains(pos[0], pos[1]):
             return True
 
         # Handle children in reverse z-index order
-        sorted_children = sorted(self._children, key=lambda c: c.z_index, reverse=True)
-        for child in sorted_children:
+        for child in reversed(self._children):
             if child.handle_event(event):
                 return True
 
@@ -2,10 +2,16 @@
 from dataclasses import dataclass
 from typing import cast
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Vector2D:
-    """2D vector with basic operations."""
+    """2D vector with basic operations.
+
+    Vectors are created for nearly every arithmetic result, so instances are
+    slotted to keep them small and cheap to allocate.
+    """
 
     x: float = 0.0
     y: float = 0.0
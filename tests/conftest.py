@@ -1,14 +1,131 @@
 """Pytest configuration and fixtures."""
-from typing import Generator
+import os
+import wave
+from typing import Callable, Dict, Generator, Tuple
 
 import pygame
 import pytest
 
+from src.core.sprite import SpriteFrame, SpriteSheet
 
-@pytest.fixture(autouse=True)
+# 500ms of 16-bit mono silence at 44.1kHz, allocated once. Long enough that
+# clips are still playing when tests check get_busy() right after play(), even
+# on a loaded machine or under pytest-xdist.
+_SILENCE = bytes(22050 * 2)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Configure SDL and the mixer.
+
+    Runs before any pygame module is initialized, so SDL never probes the real
+    audio or video devices.
+    """
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    # Every mixer.init() in the session, including the re-init in
+    # AudioManager.cleanup(), opens in the test WAV's format
+    pygame.mixer.pre_init(frequency=44100, size=-16, channels=1)
+
+
+@pytest.fixture(scope="session", autouse=True)
 def pygame_init() -> Generator[None, None, None]:
-    """Initialize pygame before each test."""
-    pygame.init()
-    pygame.display.set_mode((800, 600))  # Create a window large enough for UI tests
+    """Shut pygame down once the whole test session is done.
+
+    The display is opened lazily by pygame_display, so audio-only runs never
+    create a window, and the mixer is left to the audio tests.
+    """
     yield
     pygame.quit()
+
+
+@pytest.fixture(autouse=True)
+def pygame_display(request: pytest.FixtureRequest) -> None:
+    """Give each non-audio test a clear display, opening it on first use."""
+    if request.node.get_closest_marker("audio") is not None:
+        return
+    surface = pygame.display.get_surface() if pygame.display.get_init() else None
+    if surface is None:
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode((800, 600))  # Large enough for the UI tests
+    else:
+        surface.fill((0, 0, 0))
+
+
+@pytest.fixture(scope="session")
+def test_audio_file(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Create a silent WAV file once and share it across the audio tests."""
+    path = tmp_path_factory.mktemp("audio") / "test.wav"
+    # One buffered file object, so the small header writes become one syscall
+    with open(path, "wb", buffering=1 << 16) as f, wave.open(f, "wb") as wav_file:
+        wav_file.setnchannels(1)  # Mono
+        wav_file.setsampwidth(2)  # 16-bit
+        wav_file.setframerate(44100)  # 44.1kHz
+        wav_file.writeframes(_SILENCE)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def image_factory(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[int, int, Tuple[int, int, int]], str]:
+    """Get a factory for solid-color PNG files, each written once per session.
+
+    The files are shared between tests, so tests must not modify them.
+    """
+    root = tmp_path_factory.mktemp("images")
+    paths: Dict[Tuple[int, int, Tuple[int, int, int]], str] = {}
+
+    def make(width: int, height: int, color: Tuple[int, int, int]) -> str:
+        key = (width, height, color)
+        path = paths.get(key)
+        if path is None:
+            surface = pygame.Surface((width, height))
+            surface.fill(color)
+            path = str(root / f"{width}x{height}_{color[0]}_{color[1]}_{color[2]}.png")
+            pygame.image.save(surface, path)
+            paths[key] = path
+        return path
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def sprite_sheet_factory(
+    image_factory: Callable[[int, int, Tuple[int, int, int]], str],
+) -> Callable[[int, int, Tuple[int, int, int]], SpriteSheet]:
+    """Get a factory for solid-color sprite sheets, each loaded once per session.
+
+    Every sheet has a single frame covering the whole image. The sheets are
+    shared between tests, so tests must not add frames to them.
+    """
+    sheets: Dict[Tuple[int, int, Tuple[int, int, int]], SpriteSheet] = {}
+
+    def make(width: int, height: int, color: Tuple[int, int, int]) -> SpriteSheet:
+        key = (width, height, color)
+        sheet = sheets.get(key)
+        if sheet is None:
+            sheet = SpriteSheet(image_factory(width, height, color))
+            sheet.add_frame(SpriteFrame(0, 0, width, height))
+            sheets[key] = sheet
+        return sheet
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def _scratch_surface() -> pygame.Surface:
+    """Create the render target shared by scratch_surface.
+
+    Requested after pygame_display has opened the display, so the surface can
+    be converted to the display's pixel format, like the sheet textures blitted
+    onto it.
+    """
+    return pygame.Surface((128, 128)).convert()
+
+
+@pytest.fixture
+def scratch_surface(_scratch_surface: pygame.Surface) -> pygame.Surface:
+    """Get a shared 128x128 render target, cleared to black."""
+    _scratch_surface.fill((0, 0, 0))
+    return _scratch_surface
@@ -0,0 +1,23 @@
+"""Shared fixtures for the audio tests."""
+from typing import Generator
+
+import pygame
+import pytest
+
+
+@pytest.fixture(scope="package", autouse=True)
+def setup_audio() -> Generator[None, None, None]:
+    """Open the mixer once for this package and close it when the package ends.
+
+    Later tests then start with the mixer closed, whatever the run order.
+    """
+    if not pygame.mixer.get_init():
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            pytest.skip(f"Could not initialize audio: {e}")
+    yield None
+    if pygame.mixer.get_init():
+        pygame.mixer.music.stop()
+        pygame.mixer.music.unload()
+        pygame.mixer.quit()
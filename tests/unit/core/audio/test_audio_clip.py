@@ -1,48 +1,72 @@
 """Tests for the AudioClip class."""
-import os
-import wave
-from typing import Generator
+from typing import Callable, Generator, Optional
 
 import pygame
 import pytest
 
 from src.core.audio import AudioClip, AudioClipConfig
 
+pytestmark = pytest.mark.audio
+
+ClipFactory = Callable[[Optional[AudioClipConfig]], AudioClip]
+
+# Read-only configs shared by tests that never mutate them
+_DEFAULT_CONFIG = AudioClipConfig()
+_LOOP_CONFIG = AudioClipConfig(loop=True)
+
+
+class _FakeChannel:
+    """Channel stand-in for tests that only check clip bookkeeping."""
+
+    __slots__ = ("loops",)
+
+    def __init__(self) -> None:
+        self.loops: Optional[int] = None
+
+    def play(self, sound: pygame.mixer.Sound, loops: int = 0) -> None:
+        self.loops = loops
+
+    def stop(self) -> None:
+        self.loops = None
+
+    def get_busy(self) -> bool:
+        return self.loops is not None
+
+    def set_volume(self, volume: float) -> None:
+        pass
+
 
 @pytest.fixture(autouse=True)
-def setup_audio() -> Generator[None, None, None]:
-    """Set up pygame mixer for testing."""
-    os.environ["SDL_AUDIODRIVER"] = "dummy"
-    os.environ["SDL_VIDEODRIVER"] = "dummy"
-    pygame.mixer.init()
+def stop_channels() -> Generator[None, None, None]:
+    """Silence every channel a test left playing."""
     yield None
-    pygame.mixer.quit()
+    pygame.mixer.stop()
 
 
-@pytest.fixture
-def test_audio_file(tmp_path: str) -> Generator[str, None, None]:
-    """Create a test WAV file."""
-    file_path = os.path.join(tmp_path, "test.wav")
+@pytest.fixture(scope="module")
+def shared_sound(setup_audio: None, test_audio_file: str) -> pygame.mixer.Sound:
+    """Decode the test WAV once for the whole module."""
+    return pygame.mixer.Sound(test_audio_file)
 
-    # Create a simple WAV file
-    with wave.open(file_path, "w") as wav_file:
-        wav_file.setnchannels(1)  # Mono
-        wav_file.setsampwidth(2)  # 16-bit
-        wav_file.setframerate(44100)  # 44.1kHz
-        wav_file.writeframes(b"\x00" * 44100)  # 1 second of silence
 
-    yield file_path
+@pytest.fixture
+def make_clip(test_audio_file: str, shared_sound: pygame.mixer.Sound) -> ClipFactory:
+    """Build loaded clips that reuse the shared sound instead of decoding again."""
+
+    def _make(config: Optional[AudioClipConfig] = None) -> AudioClip:
+        clip = AudioClip(test_audio_file, config)
+        shared_sound.set_volume(clip.config.volume)
+        clip._sound = shared_sound
+        return clip
 
-    # Cleanup
-    if os.path.exists(file_path):
-        os.remove(file_path)
+    return _make
 
 
 def test_audio_clip_initialization(test_audio_file: str) -> None:
     """Test audio clip initialization."""
     clip = AudioClip(test_audio_file)
     assert clip.path == test_audio_file
-    assert clip.config == AudioClipConfig()
+    assert clip.config == _DEFAULT_CONFIG
     assert clip._sound is None
     assert clip._channel is None
 
@@ -57,10 +81,9 @@ def test_audio_clip_load(test_audio_file: str) -> None:
     clip.load()
 
 
-def test_audio_clip_play(test_audio_file: str) -> None:
+def test_audio_clip_play(make_clip: ClipFactory) -> None:
     """Test playing an audio clip."""
-    clip = AudioClip(test_audio_file)
-    clip.load()
+    clip = make_clip(None)
 
     # Play without specific channel
     channel = clip.play()
@@ -78,32 +101,32 @@ def test_audio_clip_play(test_audio_file: str) -> None:
     assert clip.is_playing()
 
 
-def test_audio_clip_volume(test_audio_file: str) -> None:
-    """Test volume control."""
-    clip = AudioClip(test_audio_file)
-    clip.load()
-
-    # Test valid volume values
-    clip.set_volume(0.5)
-    assert clip.config.volume == 0.5
+@pytest.mark.parametrize("volume", [0.0, 0.5, 1.0])
+def test_audio_clip_volume(make_clip: ClipFactory, volume: float) -> None:
+    """Test setting valid volume values."""
+    clip = make_clip(None)
+    clip.set_volume(volume)
+    assert clip.config.volume == volume
     if clip._sound is not None:
-        assert abs(clip._sound.get_volume() - 0.5) < 0.001
+        assert abs(clip._sound.get_volume() - volume) < 0.001
 
-    # Test volume clamping
-    with pytest.raises(ValueError):
-        clip.set_volume(1.5)  # Should raise ValueError
 
-    with pytest.raises(ValueError):
-        clip.set_volume(-0.5)  # Should raise ValueError
+def test_audio_clip_loop(make_clip: ClipFactory) -> None:
+    """Test that looping clips ask the channel to repeat forever."""
+    channel = _FakeChannel()
+    make_clip(_LOOP_CONFIG).play(channel)  # type: ignore[arg-type]
+    assert channel.loops == -1
+
+    make_clip(None).play(channel)  # type: ignore[arg-type]
+    assert channel.loops == 0
 
 
-def test_audio_clip_unload(test_audio_file: str) -> None:
+def test_audio_clip_unload(make_clip: ClipFactory) -> None:
     """Test unloading an audio clip."""
-    clip = AudioClip(test_audio_file)
-    clip.load()
+    clip = make_clip(None)
 
     # Play and then unload
-    channel = clip.play()
+    channel = clip.play(_FakeChannel())  # type: ignore[arg-type]
     assert channel is not None
 
     clip.stop()  # Stop before unloading
@@ -125,17 +148,11 @@ def test_audio_clip_error_handling(test_audio_file: str) -> None:
         clip.play()
 
 
-def test_audio_clip_invalid_volume(test_audio_file: str) -> None:
-    """Test setting invalid volume values."""
-    clip = AudioClip(test_audio_file)
-    clip.load()
-
-    # Test invalid volume values
-    with pytest.raises(ValueError):
-        clip.set_volume(float("inf"))
-
-    with pytest.raises(ValueError):
-        clip.set_volume(float("nan"))
-
+@pytest.mark.parametrize(
+    "volume", [1.5, -0.5, -1.0, float("inf"), float("-inf"), float("nan")]
+)
+def test_audio_clip_invalid_volume(make_clip: ClipFactory, volume: float) -> None:
+    """Test that out-of-range volume values are rejected."""
+    clip = make_clip(None)
     with pytest.raises(ValueError):
-        clip.set_volume(-1.0)
+        clip.set_volume(volume)
@@ -1,8 +1,5 @@
 """Tests for the AudioManager class."""
-import os
-import wave
-from pathlib import Path
-from typing import Generator
+from typing import Generator, List
 
 import pygame
 import pytest
@@ -10,77 +7,27 @@ import pytest
 from src.core.audio.audio_clip import AudioClip
 from src.core.audio.audio_manager import AudioManager
 
+pytestmark = pytest.mark.audio
+
+
+@pytest.fixture(scope="module")
+def audio_manager(setup_audio: None) -> AudioManager:
+    """Create one AudioManager shared by the tests in this module."""
+    return AudioManager()
+
 
 @pytest.fixture(autouse=True)
-def setup_audio() -> Generator[None, None, None]:
-    """Set up audio for testing."""
-    os.environ["SDL_AUDIODRIVER"] = "dummy"
-    pygame.mixer.init()
+def reset_playback(audio_manager: AudioManager) -> Generator[None, None, None]:
+    """Stop playback and restore the shared manager's state after each test."""
     yield None
-    pygame.mixer.quit()
-
-
-@pytest.fixture
-def audio_manager() -> Generator[AudioManager, None, None]:
-    """Create an AudioManager instance for testing."""
-    # Set dummy audio driver before any pygame initialization
-    os.environ["SDL_AUDIODRIVER"] = "dummy"
-    os.environ["SDL_VIDEODRIVER"] = "dummy"
-
-    try:
-        pygame.mixer.init()
-        manager = AudioManager()
-        yield manager
-    except pygame.error as e:
-        pytest.skip(f"Could not initialize audio: {e}")
-    finally:
-        try:
-            pygame.mixer.quit()
-        except pygame.error:
-            pass
-
-
-@pytest.fixture
-def test_audio_file() -> Generator[str, None, None]:
-    """Create a test audio file."""
-    test_file = "test.wav"
-    if not os.path.exists(test_file):
-        # Create a simple WAV file for testing
-        with wave.open(test_file, "wb") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(44100)  # 44.1kHz
-            wav_file.writeframes(b"\x00" * 44100)  # 1 second of silence
-    yield test_file
-    # Stop any playing music and unload it
-    try:
-        pygame.mixer.music.stop()
-        pygame.mixer.music.unload()
-        # Small delay to ensure resources are released
-        pygame.time.wait(100)
-    except pygame.error:
-        pass
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    audio_manager.reset()
 
 
 def test_audio_manager_initialization() -> None:
     """Test AudioManager initialization."""
-    # Set dummy audio driver before any pygame initialization
-    os.environ["SDL_AUDIODRIVER"] = "dummy"
-    os.environ["SDL_VIDEODRIVER"] = "dummy"
-
-    try:
-        pygame.mixer.init()
-        manager = AudioManager()
-        assert manager is not None
-    except pygame.error as e:
-        pytest.skip(f"Could not initialize audio: {e}")
-    finally:
-        try:
-            pygame.mixer.quit()
-        except pygame.error:
-            pass
+    manager = AudioManager()
+    assert manager is not None
+    assert pygame.mixer.get_init()
 
 
 def test_load_clip(audio_manager: AudioManager, test_audio_file: str) -> None:
@@ -120,39 +67,49 @@ def test_music_controls(audio_manager: AudioManager, test_audio_file: str) -> No
     assert not pygame.mixer.music.get_busy()
 
 
-def test_volume_control(audio_manager: AudioManager) -> None:
-    """Test volume control."""
-    # Test master volume
-    audio_manager.set_master_volume(0.5)
-    assert audio_manager._master_volume == 0.5
+def _play_many(
+    manager: AudioManager, clip: AudioClip, count: int
+) -> List[pygame.mixer.Channel]:
+    """Play a clip count times and return the channels that accepted it."""
+    play = manager.play_sound
+    return [
+        channel for channel in (play(clip) for _ in range(count)) if channel is not None
+    ]
 
-    # Test music volume
-    audio_manager.set_music_volume(0.7)
-    assert audio_manager._music_volume == 0.7
 
-    # Test sound volume
-    audio_manager.set_sound_volume(0.3)
-    assert audio_manager._sound_volume == 0.3
+_VOLUME_SETTERS = [
+    ("set_master_volume", "_master_volume"),
+    ("set_music_volume", "_music_volume"),
+    ("set_sound_volume", "_sound_volume"),
+]
 
-    # Test invalid values
-    with pytest.raises(ValueError):
-        audio_manager.set_master_volume(-0.1)
-    with pytest.raises(ValueError):
-        audio_manager.set_music_volume(1.1)
+
+@pytest.mark.parametrize("setter, attribute", _VOLUME_SETTERS)
+@pytest.mark.parametrize("volume", [0.0, 0.3, 1.0])
+def test_volume_control(
+    audio_manager: AudioManager, setter: str, attribute: str, volume: float
+) -> None:
+    """Test setting valid volume levels."""
+    getattr(audio_manager, setter)(volume)
+    assert getattr(audio_manager, attribute) == volume
+
+
+@pytest.mark.parametrize("setter, attribute", _VOLUME_SETTERS)
+@pytest.mark.parametrize("volume", [-0.1, 1.1, float("inf"), float("nan")])
+def test_invalid_volume(
+    audio_manager: AudioManager, setter: str, attribute: str, volume: float
+) -> None:
+    """Test that out-of-range volume levels are rejected and leave state alone."""
     with pytest.raises(ValueError):
-        audio_manager.set_sound_volume(float("inf"))
+        getattr(audio_manager, setter)(volume)
+    assert getattr(audio_manager, attribute) == 1.0
 
 
 def test_channel_allocation(audio_manager: AudioManager, test_audio_file: str) -> None:
     """Test channel allocation for sound effects."""
     clip = audio_manager.load_clip(path=test_audio_file)
     assert clip is not None, "Failed to load audio clip"
-    channels = []
-    # Play multiple sounds
-    for _ in range(pygame.mixer.get_num_channels()):
-        channel = audio_manager.play_sound(clip)
-        if channel is not None:
-            channels.append(channel)
+    channels = _play_many(audio_manager, clip, pygame.mixer.get_num_channels())
 
     # All channels should be busy
     assert len(channels) > 0
@@ -163,18 +120,30 @@ def test_stop_all(audio_manager: AudioManager, test_audio_file: str) -> None:
     """Test stopping all sounds."""
     clip = audio_manager.load_clip(path=test_audio_file)
     assert clip is not None, "Failed to load audio clip"
-    channels = []
-    # Play multiple sounds
-    for _ in range(4):
-        channel = audio_manager.play_sound(clip)
-        if channel is not None:
-            channels.append(channel)
+    channels = _play_many(audio_manager, clip, 4)
 
     # Stop all sounds
     audio_manager.stop_all()
     assert all(not channel.get_busy() for channel in channels)
 
 
+def test_reset(audio_manager: AudioManager, test_audio_file: str) -> None:
+    """Test that reset stops playback and restores the initial state."""
+    clip = audio_manager.load_clip(path=test_audio_file)
+    assert clip is not None, "Failed to load audio clip"
+    channel = audio_manager.play_sound(clip)
+    audio_manager.play_music(test_audio_file)
+    audio_manager.set_master_volume(0.5)
+    audio_manager.set_sound_volume(0.2)
+
+    audio_manager.reset()
+    assert channel is not None and not channel.get_busy()
+    assert not pygame.mixer.music.get_busy()
+    assert audio_manager.master_volume == 1.0
+    assert audio_manager.sound_volume == 1.0
+    assert audio_manager.load_clip(path=test_audio_file) is not clip
+
+
 def test_cleanup(audio_manager: AudioManager, test_audio_file: str) -> None:
     """Test cleanup of audio resources."""
     clip = audio_manager.load_clip(path=test_audio_file)
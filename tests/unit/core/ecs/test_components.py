@@ -1,6 +1,4 @@
 """Tests for the built-in ECS components."""
-from pathlib import Path
-
 import pygame
 import pytest
 
@@ -17,14 +15,18 @@ def transform() -> Transform:
 
 
 @pytest.fixture
-def sprite_sheet(tmp_path: Path) -> SpriteSheet:
+def sprite_sheet() -> SpriteSheet:
     """Create a test sprite sheet."""
     # Create a small test image
     surface = pygame.Surface((32, 32))
     surface.fill((255, 0, 0))  # Red square
-    path = tmp_path / "test_sprite.png"
-    pygame.image.save(surface, str(path))
-    return SpriteSheet(str(path))
+    return SpriteSheet.from_surface(surface)
+
+
+@pytest.fixture(scope="module")
+def render_surface() -> pygame.Surface:
+    """Create one render target shared by the tests in this module."""
+    return pygame.Surface((100, 100))
 
 
 def test_transform_initialization(transform: Transform) -> None:
@@ -98,7 +100,9 @@ def test_transform_hierarchy() -> None:
     assert world_scale == Vector2D(8.0, 8.0)
 
 
-def test_sprite_renderer(sprite_sheet: SpriteSheet) -> None:
+def test_sprite_renderer(
+    sprite_sheet: SpriteSheet, render_surface: pygame.Surface
+) -> None:
     """Test SpriteRenderer component."""
     entity = Entity()
     transform = Transform()
@@ -118,12 +122,11 @@ def test_sprite_renderer(sprite_sheet: SpriteSheet) -> None:
         entity2.add_component(renderer2)
 
     # Test render updates config from transform
-    surface = pygame.Surface((100, 100))
     transform.position = Vector2D(10, 20)
     transform.rotation = 90
     transform.set_scale(2.0, 3.0)
 
-    renderer.render(surface)
+    renderer.render(render_surface)
     assert renderer.config.x == 10
     assert renderer.config.y == 20
     assert renderer.config.rotation == 90
@@ -131,19 +134,18 @@ def test_sprite_renderer(sprite_sheet: SpriteSheet) -> None:
     assert renderer.config.scale_y == 3.0
 
 
-def test_disabled_components(sprite_sheet: SpriteSheet) -> None:
+def test_disabled_components(
+    sprite_sheet: SpriteSheet, render_surface: pygame.Surface
+) -> None:
     """Test that disabled components behave correctly."""
     entity = Entity()
     transform = Transform()
-    entity.add_component(transform)
-
-    sprite = Sprite(sprite_sheet)
-    renderer = SpriteRenderer(sprite)
-    entity.add_component(renderer)
+    renderer = SpriteRenderer(Sprite(sprite_sheet))
+    entity.add_components([transform, renderer])
+    assert renderer._transform == transform
 
     # Test disabled renderer
-    surface = pygame.Surface((100, 100))
     renderer.enabled = False
     transform.position = Vector2D(10, 20)
-    renderer.render(surface)
+    renderer.render(render_surface)
     assert renderer.config.x == 0  # Should not update when disabled
@@ -1,5 +1,5 @@
 """Tests for the Entity class."""
-from typing import Generator
+from typing import Tuple
 
 import pytest
 
@@ -9,7 +9,11 @@ from src.core.ecs import Component, Entity
 class DummyComponent(Component):
     """Test component for testing."""
 
-    value: int = 0
+    __slots__ = ("value",)
+
+    def __init__(self, value: int = 0) -> None:
+        super().__init__()
+        self.value = value
 
 
 @pytest.fixture
@@ -18,6 +22,12 @@ def test_component() -> DummyComponent:
     return DummyComponent()
 
 
+@pytest.fixture
+def family() -> Tuple[Entity, Entity, Entity]:
+    """Create an unlinked parent and two children."""
+    return Entity("parent"), Entity("child1"), Entity("child2")
+
+
 def test_entity_initialization() -> None:
     """Test entity initialization."""
     entity = Entity("test")
@@ -31,7 +41,10 @@ def test_entity_initialization() -> None:
 def test_entity_auto_name() -> None:
     """Test auto-generated entity names."""
     entity = Entity()
-    assert entity.name  # Should have a non-empty auto-generated name
+    assert entity.name.startswith("Entity_")
+    assert isinstance(entity.id, int)
+    assert Entity().id != entity.id
+    assert Entity().name != entity.name
 
 
 def test_add_component(test_component: DummyComponent) -> None:
@@ -42,6 +55,22 @@ def test_add_component(test_component: DummyComponent) -> None:
     assert entity.get_component(DummyComponent) == test_component
 
 
+def test_add_components(test_component: DummyComponent) -> None:
+    """Test adding several components in one call."""
+    entity = Entity()
+    other = Component()
+    entity.add_components([test_component, other])
+    assert entity.get_component(DummyComponent) == test_component
+    assert entity.get_component(Component) == other
+    assert other.entity == entity
+
+    # A duplicate rejects the whole batch
+    fresh = Entity()
+    with pytest.raises(ValueError):
+        fresh.add_components([DummyComponent(), DummyComponent()])
+    assert not fresh.components
+
+
 def test_remove_component(test_component: DummyComponent) -> None:
     """Test removing a component from an entity."""
     entity = Entity()
@@ -51,6 +80,13 @@ def test_remove_component(test_component: DummyComponent) -> None:
     assert entity.get_component(DummyComponent) is None
 
 
+def test_slotted_component(test_component: DummyComponent) -> None:
+    """Test that slotted components carry no per-instance __dict__."""
+    assert not hasattr(test_component, "__dict__")
+    assert test_component.entity is None
+    assert test_component.enabled
+
+
 def test_get_component(test_component: DummyComponent) -> None:
     """Test getting a component from an entity."""
     entity = Entity()
@@ -59,11 +95,9 @@ def test_get_component(test_component: DummyComponent) -> None:
     assert entity.get_component(DummyComponent) == test_component
 
 
-def test_parent_child_relationship() -> None:
+def test_parent_child_relationship(family: Tuple[Entity, Entity, Entity]) -> None:
     """Test parent-child relationships between entities."""
-    parent = Entity("parent")
-    child1 = Entity("child1")
-    child2 = Entity("child2")
+    parent, child1, child2 = family
 
     # Test adding children
     parent.add_child(child1)
@@ -86,6 +120,15 @@ def test_parent_child_relationship() -> None:
     assert len(parent.children) == 0
 
 
+def test_child_keeps_parent_alive() -> None:
+    """Test that a parent referenced only by its child is kept."""
+    child = Entity()
+    child.set_parent(Entity())
+
+    assert child.parent is not None
+    assert child.parent.children == {child.id: child}
+
+
 def test_enable_disable() -> None:
     """Test enabling and disabling entities."""
     entity = Entity()
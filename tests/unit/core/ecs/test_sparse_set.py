@@ -0,0 +1,70 @@
+"""Tests for the SparseSet component storage."""
+import pytest
+
+from src.core.ecs import Component, Entity
+from src.core.ecs.sparse_set import SparseSet
+
+
+def test_add_and_get() -> None:
+    """Test storing and looking up components."""
+    pool = SparseSet()
+    entity = Entity()
+    component = Component()
+
+    pool.add(entity, component)
+    assert entity in pool
+    assert len(pool) == 1
+    assert pool.get(entity) is component
+    assert pool.get(Entity()) is None
+    assert pool[entity] is component
+    with pytest.raises(KeyError):
+        pool[Entity()]
+
+    # Adding again replaces the component without growing the set
+    replacement = Component()
+    pool.add(entity, replacement)
+    assert len(pool) == 1
+    assert pool.get(entity) is replacement
+
+
+def test_remove_swaps_last_into_hole() -> None:
+    """Test that removal keeps the dense lists packed."""
+    pool = SparseSet()
+    entities = [Entity() for _ in range(3)]
+    components = [Component() for _ in range(3)]
+    for entity, component in zip(entities, components):
+        pool.add(entity, component)
+
+    pool.remove(entities[0])
+    assert pool.entities == [entities[2], entities[1]]
+    assert pool.components == [components[2], components[1]]
+    assert pool.get(entities[2]) is components[2]
+    assert entities[0] not in pool
+
+    # Removing the last element and missing entities
+    pool.remove(entities[1])
+    pool.remove(entities[0])
+    assert list(pool) == [entities[2]]
+
+
+def test_remove_many() -> None:
+    """Test removing several entities in one sweep."""
+    pool = SparseSet()
+    entities = [Entity() for _ in range(5)]
+    for entity in entities:
+        pool.add(entity, Component())
+
+    pool.remove_many([entities[0], entities[4], entities[2], Entity()])
+    assert sorted(pool, key=lambda e: e.id) == [entities[1], entities[3]]
+    for position, entity in enumerate(pool.entities):
+        assert pool.get(entity) is pool.components[position]
+
+
+def test_clear() -> None:
+    """Test emptying the set."""
+    pool = SparseSet()
+    entity = Entity()
+    pool.add(entity, Component())
+    pool.clear()
+    assert len(pool) == 0
+    assert entity not in pool
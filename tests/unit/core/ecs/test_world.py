@@ -2,12 +2,17 @@
 import pytest
 
 from src.core.ecs import Component, Entity, World
+from src.core.ecs.entity import INDEX_MASK
 
 
 class DummyComponent(Component):
     """Test component for testing."""
 
-    value: int = 0
+    __slots__ = ("value",)
+
+    def __init__(self, value: int = 0) -> None:
+        super().__init__()
+        self.value = value
 
 
 @pytest.fixture
@@ -16,56 +21,92 @@ def test_component() -> DummyComponent:
     return DummyComponent()
 
 
-def test_world_initialization() -> None:
+@pytest.fixture
+def world() -> World:
+    """Create an empty world for testing."""
+    return World()
+
+
+def test_world_initialization(world: World) -> None:
     """Test that world is properly initialized."""
-    world = World()
-    assert len(world._entities) == 0
+    assert world.entity_count == 0
     assert len(world._systems) == 0
-    assert len(world._component_cache) == 0
+    assert len(world._pools) == 0
     assert len(world._pending_removal) == 0
 
 
-def test_create_entity() -> None:
+def test_create_entity(world: World) -> None:
     """Test creating entities in the world."""
-    world = World()
     entity = world.create_entity("test")
 
     assert entity.name == "test"
-    assert entity.id in world._entities
-    assert world._entities[entity.id] == entity
+    assert world.get_entity(entity.id) is entity
+    assert world.entity_count == 1
+
+
+def test_create_entities(world: World) -> None:
+    """Test creating several entities at once."""
+    entities = world.create_entities(3, names=["a", "b", "c"])
 
+    assert [entity.name for entity in entities] == ["a", "b", "c"]
+    assert [world.get_entity(entity.id) for entity in entities] == entities
+    assert len(world.create_entities(2)) == 2
+    assert world.entity_count == 5
 
-def test_remove_entity() -> None:
+    with pytest.raises(ValueError):
+        world.create_entities(2, names=["only-one"])
+
+
+def test_remove_entity(world: World) -> None:
     """Test removing entities from the world."""
-    world = World()
     entity = world.create_entity()
 
     # Mark for removal
     world.remove_entity(entity)
     assert entity.id in world._pending_removal
-    assert entity.id in world._entities  # Still exists until cleanup
+    assert world.get_entity(entity.id) is entity  # Still exists until cleanup
 
     # Update to trigger cleanup
     world.update(0.016)
-    assert entity.id not in world._entities
+    assert world.get_entity(entity.id) is None
+    assert world.entity_count == 0
     assert len(world._pending_removal) == 0
 
 
-def test_get_entity() -> None:
+def test_entity_id_reuse(world: World) -> None:
+    """Test that freed slots are reused under a new generation."""
+    old = world.create_entity()
+    world.remove_entity(old)
+    world.update(0.016)
+
+    new = world.create_entity()
+    assert new.id & INDEX_MASK == old.id & INDEX_MASK
+    assert new.id != old.id
+    assert world.get_entity(old.id) is None  # Stale ID does not match
+    assert world.get_entity(new.id) is new
+    assert new.name != old.name  # Default names are not recycled with the slot
+
+    # Default names are unique across worlds too
+    assert World().create_entity().name != new.name
+
+    # Detached entities never collide with world IDs
+    assert world.get_entity(Entity().id) is None
+
+
+def test_get_entity(world: World) -> None:
     """Test getting entities by ID."""
-    world = World()
     entity = world.create_entity()
 
     retrieved = world.get_entity(entity.id)
     assert retrieved == entity
 
     # Test getting non-existent entity
-    assert world.get_entity("non-existent") is None
+    assert world.get_entity(0xDEADBEEF) is None
+    assert world.get_entity("non-existent") is None  # type: ignore[arg-type]
 
 
-def test_add_system() -> None:
+def test_add_system(world: World) -> None:
     """Test adding and running systems."""
-    world = World()
     calls = []
 
     def test_system(dt: float) -> None:
@@ -78,21 +119,16 @@ def test_add_system() -> None:
     assert calls[0] == 0.016
 
 
-def test_get_entities_with_component(test_component: DummyComponent) -> None:
+def test_get_entities_with_component(
+    world: World, test_component: DummyComponent
+) -> None:
     """Test querying entities by component type."""
-    world = World()
-
     # Create some entities with different components
-    entity1 = world.create_entity()
+    entity1, entity2, entity3 = world.create_entities(3)
     test_component.value = 1
     entity1.add_component(test_component)
 
-    entity2 = world.create_entity()
-    component2 = DummyComponent()
-    component2.value = 2
-    entity2.add_component(component2)
-
-    entity3 = world.create_entity()  # No component
+    entity2.add_component(DummyComponent(2))  # entity3 gets no component
 
     # Test querying
     entities = world.get_entities_with_component(DummyComponent)
@@ -101,52 +137,152 @@ def test_get_entities_with_component(test_component: DummyComponent) -> None:
     assert entity2 in entities
     assert entity3 not in entities
 
-    # Test cache
-    assert DummyComponent in world._component_cache
-    assert world._component_cache[DummyComponent] == entities
+    # Later changes show up in new queries, not in earlier results
+    entity3.add_component(DummyComponent(3))
+    entity1.remove_component(DummyComponent)
+    assert entity3 not in entities
+    assert entity1 in entities
+    assert set(world.get_entities_with_component(DummyComponent)) == {
+        entity2,
+        entity3,
+    }
 
 
-def test_component_cache_invalidation(test_component: DummyComponent) -> None:
-    """Test that component cache is properly invalidated."""
-    world = World()
+def test_remove_component_while_iterating(world: World) -> None:
+    """Test that removing the queried component in a loop reaches every entity."""
+    entities = world.create_entities(5)
+    for entity in entities:
+        entity.add_component(DummyComponent())
 
-    # Create entity and cache query
-    entity = world.create_entity()
+    for entity in world.get_entities_with_component(DummyComponent):
+        entity.remove_component(DummyComponent)
+
+    assert not any(entity.has_component(DummyComponent) for entity in entities)
+    assert world.get_entities_with_component(DummyComponent) == []
+
+
+def test_component_cache_invalidation(
+    world: World, test_component: DummyComponent
+) -> None:
+    """Test that removed entities are dropped from component storage."""
+    # Create entities and query
+    entity, survivor = world.create_entities(2)
     entity.add_component(test_component)
+    survivor.add_component(DummyComponent())
     entities1 = world.get_entities_with_component(DummyComponent)
-    assert len(entities1) == 1
+    assert len(entities1) == 2
 
-    # Remove entity and verify cache is cleared
+    # Remove entity and verify the storage is updated
     world.remove_entity(entity)
     world.update(0.016)  # Trigger cleanup
-    assert len(world._component_cache) == 0
+    assert world._pools[DummyComponent].entities == [survivor]
 
     # Query again
     entities2 = world.get_entities_with_component(DummyComponent)
-    assert len(entities2) == 0
+    assert entities2 == [survivor]
 
 
-def test_clear(test_component: DummyComponent) -> None:
-    """Test clearing all entities from the world."""
-    world = World()
+def test_query_multi_component(world: World) -> None:
+    """Test iterating entities that have several component types."""
+    both, dummy_only, base_only = world.create_entities(3)
+    dummy = DummyComponent(1)
+    base = Component()
+    both.add_components([dummy, base])
+    dummy_only.add_component(DummyComponent(2))
+    base_only.add_component(Component())
+
+    results = list(world.query(DummyComponent, Component))
+    assert results == [(both, (dummy, base))]
+
+    # Order of the returned components follows the requested types
+    assert list(world.query(Component, DummyComponent)) == [(both, (base, dummy))]
+
+    # Types no entity has and empty queries match nothing
+    class UnusedComponent(Component):
+        pass
+
+    assert list(world.query(DummyComponent, UnusedComponent)) == []
+    assert list(world.query()) == []
+
+
+def test_query_cache_incremental(world: World) -> None:
+    """Test that cached queries follow component and entity changes."""
+    entity, late = world.create_entities(2)
+    entity.add_components([DummyComponent(1), Component()])
+    assert len(list(world.query(DummyComponent, Component))) == 1
+
+    key = frozenset((DummyComponent, Component))
+    matches = world._query_cache[key]
+    late.add_component(DummyComponent(2))
+    assert late.id not in matches
+    late.add_component(Component())
+    assert late.id in matches  # Added without re-running the match
+
+    late.remove_component(DummyComponent)
+    assert late.id not in matches
+    world.remove_entity(entity)
+    world.update(0.016)
+    assert list(world.query(Component, DummyComponent)) == []
+    assert world._query_cache[key] is matches
+
 
+def test_query_remove_during_iteration(world: World) -> None:
+    """Test removing queried components from later matches while iterating."""
+    entities = world.create_entities(4)
+    for entity in entities:
+        entity.add_components([DummyComponent(), Component()])
+
+    visited = []
+    for entity, _ in world.query(DummyComponent, Component):
+        visited.append(entity)
+        for other in entities:
+            if other is not entity:
+                other.remove_component(DummyComponent)
+
+    # Only the first entity still had both components when it was reached
+    assert len(visited) == 1
+    assert [entity for entity, _ in world.query(DummyComponent, Component)] == visited
+
+
+def test_clear(world: World, test_component: DummyComponent) -> None:
+    """Test clearing all entities from the world."""
     # Add some entities
     entity1 = world.create_entity()
     entity1.add_component(test_component)
     entity2 = world.create_entity()
-    world.get_entities_with_component(DummyComponent)  # Build cache
+    world.get_entities_with_component(DummyComponent)
 
     # Clear world
     world.clear()
-    assert len(world._entities) == 0
-    assert len(world._component_cache) == 0
+    assert world.entity_count == 0
+    assert world.get_entity(entity1.id) is None
+    assert len(world._pools) == 0
+    assert entity1._world is None
     assert len(world._pending_removal) == 0
 
 
-def test_parent_child_cleanup() -> None:
-    """Test that removing a parent entity also cleans up children."""
-    world = World()
+def test_remove_entities_batch(world: World) -> None:
+    """Test removing many entities in a single cleanup."""
+    entities = world.create_entities(6)
+    for value, entity in enumerate(entities):
+        entity.add_component(DummyComponent(value))
+    entities[1].set_parent(entities[0])
 
+    for entity in entities[::2]:
+        world.remove_entity(entity)
+    world.update(0.016)
+
+    survivors = entities[1::2]
+    assert world.entity_count == 3
+    assert set(world.get_entities_with_component(DummyComponent)) == set(survivors)
+    pool = world._pools[DummyComponent]
+    for entity in survivors:
+        assert pool.get(entity) is entity.get_component(DummyComponent)
+    assert entities[1].parent is None
+
+
+def test_parent_child_cleanup(world: World) -> None:
+    """Test that removing a parent entity also cleans up children."""
     # Create parent and child
     parent = world.create_entity("parent")
     child = world.create_entity("child")
@@ -156,5 +292,5 @@ def test_parent_child_cleanup() -> None:
     world.remove_entity(parent)
     world.update(0.016)  # Trigger cleanup
 
-    assert parent.id not in world._entities
+    assert world.get_entity(parent.id) is None
     assert child.parent is None  # Child should be detached
@@ -1,5 +1,5 @@
 """Tests for the audio manager."""
-import os
+from collections import OrderedDict
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
@@ -8,15 +8,26 @@ import pytest
 
 from src.core.audio import Audio
 
+pytestmark = pytest.mark.audio
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture(scope="module", autouse=True)
 def setup_pygame_audio() -> Generator[None, None, None]:
-    """Set up pygame audio for testing."""
-    # Initialize pygame with dummy audio driver
-    os.environ["SDL_AUDIODRIVER"] = "dummy"
-    pygame.mixer.init()
+    """Open the mixer once for this module unless it is already open."""
+    opened = not pygame.mixer.get_init()
+    if opened:
+        pygame.mixer.init()
     yield None
-    pygame.mixer.quit()
+    if opened:
+        pygame.mixer.quit()
+
+
+@pytest.fixture(autouse=True)
+def fresh_music_state() -> Generator[None, None, None]:
+    """Make every test poll the (possibly mocked) mixer afresh."""
+    Audio._invalidate_music_state()
+    yield None
+    Audio._invalidate_music_state()
 
 
 def test_play_sound() -> None:
@@ -33,9 +44,23 @@ def test_play_sound() -> None:
         mock_sound.assert_called_once_with("test.wav")
         mock_sound_obj.play.assert_called_once()
 
-        # Test volume setting
+        # Test volume setting; the decoded sound is reused
         Audio.play_sound("test.wav", volume=0.5)
         mock_sound_obj.set_volume.assert_called_with(0.5)
+        assert mock_sound.call_count == 1
+
+
+def test_sound_cache_evicts_least_recent(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the sound cache is bounded and keeps recently played sounds."""
+    monkeypatch.setattr(Audio, "_sounds", OrderedDict())
+    monkeypatch.setattr(Audio, "_max_cached_sounds", 2)
+    with patch("pygame.mixer.Sound") as mock_sound:
+        Audio.preload_sounds(["a.wav", "b.wav"])
+        Audio.play_sound("a.wav")  # Makes b.wav the least recently used
+        Audio.play_sound("c.wav")
+
+        assert list(Audio._sounds) == ["a.wav", "c.wav"]
+        assert mock_sound.call_count == 3
 
 
 def test_play_music() -> None:
@@ -115,6 +140,31 @@ def test_is_music_playing() -> None:
         mock_music.get_busy.assert_called_once()
 
 
+def test_music_state_polled_once_per_frame(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that music state is reused within a frame and refreshed after."""
+    now = [100.0]
+    monkeypatch.setattr("time.perf_counter", lambda: now[0])
+    with patch("pygame.mixer.music") as mock_music:
+        mock_music.get_volume.return_value = 0.5
+        mock_music.get_busy.return_value = True
+
+        for _ in range(3):
+            assert Audio.get_music_volume() == 0.5
+            assert Audio.is_music_playing() is True
+        assert mock_music.get_volume.call_count == 1
+        assert mock_music.get_busy.call_count == 1
+
+        # Changing the music drops the cached state
+        Audio.set_music_volume(0.25)
+        mock_music.get_volume.return_value = 0.25
+        assert Audio.get_music_volume() == 0.25
+
+        # So does the next frame
+        now[0] += 0.02
+        mock_music.get_busy.return_value = False
+        assert Audio.is_music_playing() is False
+
+
 def test_fade_out_music() -> None:
     """Test fading out music."""
     with patch("pygame.mixer.music") as mock_music:
@@ -1,4 +1,5 @@
 """Tests for the game loop."""
+import dataclasses
 import time
 from typing import List
 
@@ -23,6 +24,18 @@ def test_game_loop_custom_config() -> None:
     assert config.max_frame_time == 0.5
 
 
+def test_game_loop_config_derived_values() -> None:
+    """Test that frame budgets are precomputed and the config is frozen."""
+    config = GameLoopConfig(fps=50, fixed_time_step=0.01, max_frame_time=0.25)
+    assert config.target_frame_ns == 20_000_000
+    assert config.max_frame_time_ns == 250_000_000
+    assert config.max_fixed_updates == 25
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.fps = 30  # type: ignore[misc]
+    assert dataclasses.replace(config, fps=100).target_frame_ns == 10_000_000
+
+
 def test_game_loop_single_frame() -> None:
     """Test processing a single frame."""
     update_called = False
@@ -147,8 +160,51 @@ def test_fixed_timestep_accumulation() -> None:
     assert len(fixed_updates) >= 1
 
 
-def test_timing_stack() -> None:
-    """Test timing stack management."""
+def test_fixed_timestep_step_count() -> None:
+    """Test that the accumulator is drained in whole fixed steps."""
+    update_times: List[float] = []
+
+    def update(dt: float) -> None:
+        update_times.append(dt)
+
+    def render() -> None:
+        pass
+
+    fixed_step = 1.0 / 30.0
+    config = GameLoopConfig(fps=60, fixed_time_step=fixed_step)
+    loop = GameLoop(update, render, config)
+
+    loop.physics_accumulator = 0.11  # Three full steps plus a remainder
+    loop._process_frame()
+
+    assert update_times.count(fixed_step) == 3
+    assert 0 <= loop.physics_accumulator < fixed_step
+
+
+def test_fixed_timestep_backlog_is_capped() -> None:
+    """Test that a large accumulator backlog is dropped instead of replayed."""
+    update_times: List[float] = []
+
+    def update(dt: float) -> None:
+        update_times.append(dt)
+
+    def render() -> None:
+        pass
+
+    fixed_step = 1.0 / 60.0
+    config = GameLoopConfig(fixed_time_step=fixed_step, max_frame_time=0.25)
+    loop = GameLoop(update, render, config)
+
+    loop.physics_accumulator = 10.0  # Far more than one frame can catch up on
+    loop._process_frame()
+
+    assert update_times.count(fixed_step) == 15
+    assert loop._metrics.dropped_fixed_steps > 0
+    assert 0 <= loop.physics_accumulator < fixed_step
+
+
+def test_section_timing() -> None:
+    """Test that update and render sections are timed."""
 
     def update(dt: float) -> None:
         time.sleep(0.001)
@@ -163,7 +219,7 @@ def test_timing_stack() -> None:
     # Check that metrics were updated
     assert loop._metrics.update_time > 0
     assert loop._metrics.render_time > 0
-    assert not loop._timing_stack  # Stack should be empty after frame
+    assert loop._metrics.fixed_update_time >= 0
 
 
 def test_frame_time_history() -> None:
@@ -187,6 +243,39 @@ def test_frame_time_history() -> None:
     assert len(loop._frame_times) == 5
 
 
+def test_frame_time_running_average() -> None:
+    """Test that the running average matches the sampled frame times."""
+
+    def update(dt: float) -> None:
+        pass
+
+    def render() -> None:
+        pass
+
+    config = GameLoopConfig(fps=60, fps_sample_size=3)
+    loop = GameLoop(update, render, config)
+
+    for _ in range(7):
+        loop._process_frame()
+
+    expected = sum(loop._frame_times) / len(loop._frame_times)
+    assert loop._metrics.avg_frame_time == pytest.approx(expected)
+    assert loop._metrics.min_frame_time == min(loop._frame_times)
+    assert loop._metrics.max_frame_time == max(loop._frame_times)
+
+
+def test_frame_time_window_min_max() -> None:
+    """Test that min/max follow the sliding window as samples are evicted."""
+    loop = GameLoop(lambda dt: None, lambda: None, GameLoopConfig(fps_sample_size=3))
+    samples = [0.5, 0.1, 0.3, 0.4, 0.2, 0.9, 0.1, 0.1, 0.6]
+
+    for frame_time in samples:
+        loop._record_frame_time(frame_time)
+        loop._update_metrics()
+        assert loop._metrics.min_frame_time == min(loop._frame_times)
+        assert loop._metrics.max_frame_time == max(loop._frame_times)
+
+
 def test_sleep_calculation() -> None:
     """Test sleep time calculation in the game loop."""
     sleep_times: List[float] = []
@@ -214,6 +303,47 @@ def test_sleep_calculation() -> None:
         time.sleep = original_sleep
 
 
+def test_frame_pacing_uses_absolute_deadlines() -> None:
+    """Test that frames are paced against a fixed schedule."""
+
+    def update(dt: float) -> None:
+        pass
+
+    def render() -> None:
+        pass
+
+    config = GameLoopConfig(fps=100)
+    loop = GameLoop(update, render, config)
+    loop.start()
+    first_deadline_ns = loop._next_deadline_ns
+
+    start_time = time.perf_counter()
+    for _ in range(3):
+        loop.run_one_frame()
+
+    assert time.perf_counter() - start_time >= 0.03 - 0.01
+    assert loop._next_deadline_ns == first_deadline_ns + 30_000_000
+
+
+def test_frame_deadline_resets_after_stall() -> None:
+    """Test that a long stall restarts the schedule instead of catching up."""
+
+    def update(dt: float) -> None:
+        pass
+
+    def render() -> None:
+        pass
+
+    loop = GameLoop(update, render, GameLoopConfig(fps=60))
+    loop.start()
+    # Pretend the previous frame stalled for a second
+    loop._next_deadline_ns -= 1_000_000_000
+
+    loop.run_one_frame()
+
+    assert loop._next_deadline_ns > time.perf_counter_ns()
+
+
 def test_invalid_config_values() -> None:
     """Test validation of all config parameters."""
     with pytest.raises(ValueError):
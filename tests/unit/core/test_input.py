@@ -1,12 +1,61 @@
 """Tests for the input system."""
 import time
-from typing import Dict, Set
+from typing import Dict, Generator, Set
 
 import pygame
 import pytest
 
 from src.core.input import InputAction, InputBinding, InputManager, InputState
 
+# Shared events; the input manager only reads them
+_DOWN_A = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a})
+_UP_A = pygame.event.Event(pygame.KEYUP, {"key": pygame.K_a})
+_DOWN_LEFT = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_LEFT})
+_UP_LEFT = pygame.event.Event(pygame.KEYUP, {"key": pygame.K_LEFT})
+_DOWN_RIGHT = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_RIGHT})
+_DOWN_SPACE = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_SPACE})
+_UP_SPACE = pygame.event.Event(pygame.KEYUP, {"key": pygame.K_SPACE})
+_DOWN_X = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_x})
+_MOUSE_MOTION = pygame.event.Event(pygame.MOUSEMOTION, {"pos": (0, 0)})
+
+
+@pytest.fixture(scope="module")
+def shared_manager() -> InputManager:
+    """Create one input manager for the module."""
+    return InputManager()
+
+
+class _FakeClock:
+    """Stand-in for time.perf_counter that only moves when told to."""
+
+    __slots__ = ("now",)
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(manager: InputManager, monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    """Drive the input manager's wall clock by hand.
+
+    Requests the manager before monkeypatch so the manager's teardown reset
+    runs after the real clock is restored.
+    """
+    fake = _FakeClock()
+    monkeypatch.setattr(time, "perf_counter", fake)
+    manager.reset()  # Restart the frame timer on the fake clock
+    return fake
+
+
+@pytest.fixture
+def manager(shared_manager: InputManager) -> Generator[InputManager, None, None]:
+    """Provide the shared input manager, reset after each test."""
+    yield shared_manager
+    shared_manager.reset()
+
 
 def test_input_manager_initialization() -> None:
     """Test input manager initialization."""
@@ -18,9 +67,24 @@ def test_input_manager_initialization() -> None:
     assert not manager._buffer_times
 
 
-def test_action_registration() -> None:
+def test_reset(manager: InputManager) -> None:
+    """Test that reset returns the manager to its initial state."""
+    manager.register_action("JUMP", buffer_time=0.1)
+    manager.bind_key("JUMP", pygame.K_SPACE)
+    manager.process_event(_DOWN_SPACE)
+
+    manager.reset()
+    assert not manager._bindings
+    assert not manager._key_to_action
+    assert not manager._pressed
+    assert not manager._held
+    assert not manager._buffer_times
+    assert not manager._buffer_durations
+    manager.register_action("JUMP")  # Name is free again
+
+
+def test_action_registration(manager: InputManager) -> None:
     """Test registering input actions."""
-    manager = InputManager()
     manager.register_action("JUMP")
     assert "JUMP" in manager._bindings
     assert not manager._bindings["JUMP"]  # No keys bound yet
@@ -36,9 +100,8 @@ def test_action_registration() -> None:
         manager.register_action("JUMP")
 
 
-def test_key_binding() -> None:
+def test_key_binding(manager: InputManager) -> None:
     """Test binding keys to actions."""
-    manager = InputManager()
     manager.register_action("JUMP")
     manager.bind_key("JUMP", pygame.K_SPACE)
 
@@ -55,15 +118,13 @@ def test_key_binding() -> None:
         manager.bind_key("NONEXISTENT", pygame.K_SPACE)
 
 
-def test_input_state() -> None:
+def test_input_state(manager: InputManager) -> None:
     """Test input state tracking."""
-    manager = InputManager()
     manager.register_action("JUMP")
     manager.bind_key("JUMP", pygame.K_SPACE)
 
     # Test key press
-    event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_SPACE})
-    manager.process_event(event)
+    manager.process_event(_DOWN_SPACE)
 
     assert manager.is_pressed("JUMP")
     assert manager.is_held("JUMP")
@@ -76,8 +137,7 @@ def test_input_state() -> None:
     assert not manager.is_released("JUMP")
 
     # Test key release
-    event = pygame.event.Event(pygame.KEYUP, {"key": pygame.K_SPACE})
-    manager.process_event(event)
+    manager.process_event(_UP_SPACE)
 
     assert not manager.is_pressed("JUMP")
     assert not manager.is_held("JUMP")
@@ -90,37 +150,35 @@ def test_input_state() -> None:
     assert not manager.is_released("JUMP")
 
 
-def test_input_buffering() -> None:
+def test_input_buffering(manager: InputManager, clock: _FakeClock) -> None:
     """Test input buffering system."""
-    manager = InputManager()
     manager.register_action("ATTACK", buffer_time=0.1)  # 100ms buffer
     manager.bind_key("ATTACK", pygame.K_x)
 
     # Test key press
-    event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_x})
-    manager.process_event(event)
+    manager.process_event(_DOWN_X)
 
     assert manager.is_pressed("ATTACK")
     assert manager.is_held("ATTACK")
     assert manager.is_buffered("ATTACK")
 
     # After update, should still be held and buffered
+    clock.now += 0.05
     manager.update()
     assert not manager.is_pressed("ATTACK")
     assert manager.is_held("ATTACK")
     assert manager.is_buffered("ATTACK")
 
     # Test buffer expiration
-    manager._buffer_times["ATTACK"] = -0.1  # Force buffer expiration
+    clock.now += 0.06
     manager.update()
     assert not manager.is_pressed("ATTACK")
     assert manager.is_held("ATTACK")
     assert not manager.is_buffered("ATTACK")
 
 
-def test_action_mapping() -> None:
+def test_action_mapping(manager: InputManager) -> None:
     """Test action mapping system."""
-    manager = InputManager()
 
     # Create a mapping
     mapping = {
@@ -139,9 +197,8 @@ def test_action_mapping() -> None:
             assert manager._key_to_action[key] == action
 
 
-def test_binding_management() -> None:
+def test_binding_management(manager: InputManager) -> None:
     """Test managing key bindings."""
-    manager = InputManager()
     manager.register_action("TEST")
     manager.bind_key("TEST", pygame.K_a)
 
@@ -157,111 +214,129 @@ def test_binding_management() -> None:
     assert pygame.K_b not in manager._key_to_action
 
 
-def test_multiple_key_bindings() -> None:
+def test_multiple_key_bindings(manager: InputManager) -> None:
     """Test handling multiple key bindings for an action."""
-    manager = InputManager()
     manager.register_action("MOVE")
     manager.bind_key("MOVE", pygame.K_LEFT)
     manager.bind_key("MOVE", pygame.K_a)
 
-    # Test both keys trigger the action
-    event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_LEFT})
-    manager.process_event(event)
-    manager.update()
-    assert manager.is_held("MOVE")
+    # Test both keys trigger the action; releasing one key clears the held
+    # state, so no update is needed between them
+    for down, up in ((_DOWN_LEFT, _UP_LEFT), (_DOWN_A, _UP_A)):
+        manager.process_event(down)
+        assert manager.is_pressed("MOVE")
+        assert manager.is_held("MOVE")
+        manager.process_event(up)
+        assert not manager.is_held("MOVE")
 
-    event = pygame.event.Event(pygame.KEYUP, {"key": pygame.K_LEFT})
-    manager.process_event(event)
     manager.update()
+    assert not manager.is_pressed("MOVE")
+    assert not manager.is_released("MOVE")
 
-    event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a})
-    manager.process_event(event)
-    manager.update()
-    assert manager.is_held("MOVE")
+
+def test_process_events_in_order(manager: InputManager) -> None:
+    """Test that a batch of events is applied in order."""
+    manager.register_action("JUMP", buffer_time=0.1)
+    manager.bind_key("JUMP", pygame.K_SPACE)
+    manager.process_events([_DOWN_SPACE, _MOUSE_MOTION, _UP_SPACE, _DOWN_SPACE])
+    assert manager.is_pressed("JUMP")
+    assert manager.is_released("JUMP")
+    assert manager.is_held("JUMP")  # Pressed again after the release
+    assert manager.is_buffered("JUMP")
+
+    manager.update(0.016)
+    manager.process_events([_UP_SPACE, _DOWN_SPACE, _UP_SPACE])
+    assert manager.is_released("JUMP")
+    assert not manager.is_held("JUMP")
 
 
-def test_simultaneous_keys() -> None:
+def test_simultaneous_keys(manager: InputManager) -> None:
     """Test handling multiple keys pressed simultaneously."""
-    input_manager = InputManager()
-    input_manager.register_action("MOVE_LEFT")
-    input_manager.register_action("MOVE_RIGHT")
+    manager.register_action("MOVE_LEFT")
+    manager.register_action("MOVE_RIGHT")
 
-    input_manager.bind_key("MOVE_LEFT", pygame.K_LEFT)
-    input_manager.bind_key("MOVE_RIGHT", pygame.K_RIGHT)
+    manager.bind_key("MOVE_LEFT", pygame.K_LEFT)
+    manager.bind_key("MOVE_RIGHT", pygame.K_RIGHT)
 
     # Press both keys
-    event1 = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_LEFT})
-    event2 = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_RIGHT})
-
-    input_manager.process_event(event1)
-    input_manager.process_event(event2)
-    input_manager.update()
+    manager.process_events([_DOWN_LEFT, _DOWN_RIGHT])
+    manager.update()
 
-    assert input_manager.is_held("MOVE_LEFT")
-    assert input_manager.is_held("MOVE_RIGHT")
+    assert manager.is_held("MOVE_LEFT")
+    assert manager.is_held("MOVE_RIGHT")
+    assert bin(manager._held).count("1") == 2  # One bit per held action
 
     # Release one key
-    event = pygame.event.Event(pygame.KEYUP, {"key": pygame.K_LEFT})
-    input_manager.process_event(event)
-    input_manager.update()
+    manager.process_event(_UP_LEFT)
+    manager.update()
 
-    assert not input_manager.is_held("MOVE_LEFT")
-    assert input_manager.is_held("MOVE_RIGHT")
+    assert not manager.is_held("MOVE_LEFT")
+    assert manager.is_held("MOVE_RIGHT")
 
 
-def test_buffer_timing_precision() -> None:
+def test_buffer_timing_precision(manager: InputManager, clock: _FakeClock) -> None:
     """Test precise timing of input buffer system."""
-    input_manager = InputManager()
     buffer_time = 0.1  # 100ms
-    input_manager.register_action("ATTACK", buffer_time=buffer_time)
-    input_manager.bind_key("ATTACK", pygame.K_x)
+    manager.register_action("ATTACK", buffer_time=buffer_time)
+    manager.bind_key("ATTACK", pygame.K_x)
 
     # Simulate key press
-    event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_x})
-    input_manager.process_event(event)
+    manager.process_event(_DOWN_X)
 
     # Check buffer just before expiration
-    input_manager._buffer_times["ATTACK"] = buffer_time * 0.9
-    input_manager.update()
-    assert input_manager.is_buffered("ATTACK")
+    clock.now += buffer_time * 0.9
+    manager.update()
+    assert manager.is_buffered("ATTACK")
 
     # Check buffer just after expiration
-    input_manager._buffer_times["ATTACK"] = -0.001
-    input_manager.update()
-    assert not input_manager.is_buffered("ATTACK")
+    clock.now += buffer_time * 0.1 + 0.001
+    manager.update()
+    assert not manager.is_buffered("ATTACK")
+
+
+def test_buffer_decays_by_frame_delta(manager: InputManager) -> None:
+    """Test that buffered input decays by the supplied frame delta."""
+    manager.register_action("ATTACK", buffer_time=0.1)
+    manager.bind_key("ATTACK", pygame.K_x)
+
+    manager.process_event(_DOWN_X)
+
+    manager.update(0.06)
+    assert manager.is_buffered("ATTACK")
+    assert manager._buffer_times["ATTACK"] == pytest.approx(0.04)
+
+    manager.update(0.06)
+    assert not manager.is_buffered("ATTACK")
 
 
-def test_action_state_transitions() -> None:
+def test_action_state_transitions(manager: InputManager) -> None:
     """Test all possible state transitions for an action."""
-    input_manager = InputManager()
-    input_manager.register_action("TEST")
-    input_manager.bind_key("TEST", pygame.K_a)
+    manager.register_action("TEST")
+    manager.bind_key("TEST", pygame.K_a)
 
     # Initial state
-    assert not input_manager.is_pressed("TEST")
-    assert not input_manager.is_held("TEST")
-    assert not input_manager.is_released("TEST")
+    assert not manager.is_pressed("TEST")
+    assert not manager.is_held("TEST")
+    assert not manager.is_released("TEST")
 
     # Press -> should be PRESSED
-    event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a})
-    input_manager.process_event(event)
-    assert input_manager.is_pressed("TEST")
-    assert input_manager.is_held("TEST")
+    manager.process_event(_DOWN_A)
+    assert manager.is_pressed("TEST")
+    assert manager.is_held("TEST")
 
     # Update -> should transition to HELD
-    input_manager.update()
-    assert not input_manager.is_pressed("TEST")
-    assert input_manager.is_held("TEST")
+    manager.update()
+    assert not manager.is_pressed("TEST")
+    assert manager.is_held("TEST")
 
     # Release -> should be RELEASED
-    event = pygame.event.Event(pygame.KEYUP, {"key": pygame.K_a})
-    input_manager.process_event(event)
-    assert not input_manager.is_pressed("TEST")
-    assert not input_manager.is_held("TEST")
-    assert input_manager.is_released("TEST")
+    manager.process_event(_UP_A)
+    assert not manager.is_pressed("TEST")
+    assert not manager.is_held("TEST")
+    assert manager.is_released("TEST")
 
     # Update -> should clear state
-    input_manager.update()
-    assert not input_manager.is_pressed("TEST")
-    assert not input_manager.is_held("TEST")
-    assert not input_manager.is_released("TEST")
+    manager.update()
+    assert not manager.is_pressed("TEST")
+    assert not manager.is_held("TEST")
+    assert not manager.is_released("TEST")
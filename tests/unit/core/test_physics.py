@@ -1,4 +1,6 @@
 """Tests for the physics system."""
+import sys
+
 import pytest
 
 from src.core.physics import PhysicsBody, PhysicsConfig, PhysicsState, Vector2D
@@ -34,6 +36,15 @@ def test_vector_operations() -> None:
         v1 / 0.0
 
 
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+def test_vector_uses_slots() -> None:
+    """Test that vectors store their components in slots."""
+    v = Vector2D(3.0, 4.0)
+    assert Vector2D.__slots__ == ("x", "y")
+    assert not hasattr(v, "__dict__")
+    assert v == Vector2D(3.0, 4.0)
+
+
 def test_vector_magnitude() -> None:
     """Test vector magnitude calculation."""
     v = Vector2D(3.0, 4.0)
@@ -159,12 +170,32 @@ def test_physics_collision() -> None:
     assert body.state.velocity.y == -5.0  # Should bounce upward with half velocity
     assert not body.state.grounded  # Should not be grounded during bounce
 
-    # After bounce is complete (velocity is upward), object should not be grounded
-    body.state.velocity = Vector2D(0.0, 0.0)  # Zero velocity
+    # Once at rest, a collision grounds the body instead of bouncing
+    body.reset(0.0, body.state.position.y)
     body.handle_collision(normal, 0.0)  # Another collision with no penetration
     assert body.state.grounded  # Now should be grounded since not bouncing
 
 
+def test_physics_reset() -> None:
+    """Test putting a body back at rest."""
+    body = PhysicsBody(PhysicsConfig())
+    body.set_velocity(Vector2D(3.0, 4.0))
+    body.apply_force(Vector2D(1.0, 1.0))
+    body.state.grounded = True
+    spawn = Vector2D(1.0, 2.0)
+    body.state.position = spawn
+    state = body.state
+
+    body.reset(10.5, 20.0)
+    assert body.state is state
+    assert body.state.position == Vector2D(10.5, 20.0)
+    assert body.state.velocity == Vector2D()
+    assert body.state.acceleration == Vector2D()
+    assert not body.state.grounded
+    assert body.collision_rect.topleft == (10, 20)
+    assert spawn == Vector2D(1.0, 2.0)  # Shared vectors are left alone
+
+
 def test_physics_integration() -> None:
     """Test complete physics integration."""
     config = PhysicsConfig(
@@ -186,3 +217,23 @@ def test_physics_integration() -> None:
     assert body.state.position.x > 0
     assert body.state.position.y != 0
     assert body.state.velocity.y > -10.0  # Should have slowed down upward velocity
+
+
+def test_physics_integration_closed_form() -> None:
+    """Test that free flight matches the constant-acceleration solution."""
+    config = PhysicsConfig(
+        gravity=Vector2D(0.0, 10.0), max_velocity=Vector2D(100.0, 100.0)
+    )
+    body = PhysicsBody(config)
+    body.set_velocity(Vector2D(5.0, -10.0))
+
+    dt, steps = 0.016, 10
+    for _ in range(steps):
+        body.update(dt)
+
+    # Averaging start and end velocity is exact under constant acceleration
+    t = dt * steps
+    assert body.state.velocity.x == pytest.approx(5.0)
+    assert body.state.velocity.y == pytest.approx(-10.0 + 10.0 * t)
+    assert body.state.position.x == pytest.approx(5.0 * t)
+    assert body.state.position.y == pytest.approx(-10.0 * t + 0.5 * 10.0 * t * t)
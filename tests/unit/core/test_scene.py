@@ -1,5 +1,5 @@
 """Unit tests for the Scene class."""
-import pytest
+from typing import List
 
 from src.core.ecs.world import World
 from src.core.scene import Scene
@@ -16,27 +16,42 @@ def test_scene_initialization() -> None:
 
 
 def test_scene_lifecycle() -> None:
-    """Test scene lifecycle methods."""
+    """Test scene lifecycle methods and when the world is updated."""
     scene = Scene("test_scene")
+    world = scene.world
+    assert isinstance(world, World)
+    updates: List[float] = []
+    world.add_system(updates.append)
 
-    # Test initialize
+    # Test initialize; the world only runs once the scene is loaded
     scene.initialize()
     assert scene.initialized
+    scene.update(0.016)
+    assert updates == []
 
     # Test load
     scene.load()
     assert scene.active
     assert not scene.paused
+    scene.update(0.016)  # Typical frame time
+    assert updates == [0.016]
 
     # Test pause/resume
     scene.pause()
     assert scene.paused
+    scene.update(0.016)
+    assert len(updates) == 1
     scene.resume()
     assert not scene.paused
+    scene.update(0.016)
+    assert len(updates) == 2
 
     # Test unload
     scene.unload()
     assert not scene.active
+    scene.update(0.016)
+    assert len(updates) == 2
+    assert scene.world is world
 
 
 def test_scene_environment_variables() -> None:
@@ -53,38 +68,3 @@ def test_scene_environment_variables() -> None:
     # Test overwriting variable
     scene.set_environment_variable("test_var", "new_value")
     assert scene.get_environment_variable("test_var") == "new_value"
-
-
-def test_scene_update() -> None:
-    """Test scene update behavior."""
-    scene = Scene("test_scene")
-    scene.initialize()
-    scene.load()
-
-    # Scene should update when active and not paused
-    scene.update(0.016)  # Typical frame time
-
-    # Scene should not update when paused
-    scene.pause()
-    scene.update(0.016)
-
-    # Scene should not update when unloaded
-    scene.unload()
-    scene.update(0.016)
-
-
-def test_scene_world_management() -> None:
-    """Test scene world management."""
-    scene = Scene("test_scene")
-
-    # World should be created on initialization
-    assert scene.world is not None
-
-    # World should be accessible
-    world = scene.world
-    assert isinstance(world, World)
-
-    # Test that world updates with scene
-    scene.initialize()
-    scene.load()
-    scene.update(0.016)  # Should trigger world update
@@ -29,15 +29,15 @@ def scene_manager() -> SceneManager:
 
 @pytest.fixture
 def mock_scenes() -> List[MockScene]:
-    """Create mock scenes for testing."""
-    return [MockScene(f"scene{i}") for i in range(3)]
+    """Create the two mock scenes the tests need."""
+    return [MockScene(f"scene{i}") for i in range(2)]
 
 
 def test_scene_registration(
     scene_manager: SceneManager, mock_scenes: List[MockScene]
 ) -> None:
     """Test scene registration."""
-    scene1, scene2 = mock_scenes[:2]
+    scene1, scene2 = mock_scenes
 
     # Test registration
     scene_manager.register_scene(scene1)
@@ -56,7 +56,7 @@ def test_scene_stack_operations(
     scene_manager: SceneManager, mock_scenes: List[MockScene]
 ) -> None:
     """Test scene stack push operations."""
-    scene1, scene2 = mock_scenes[:2]
+    scene1, scene2 = mock_scenes
 
     # Test initial push
     scene_manager.push_scene(scene1)
@@ -74,7 +74,7 @@ def test_scene_stack_pop(
     scene_manager: SceneManager, mock_scenes: List[MockScene]
 ) -> None:
     """Test scene stack pop operations."""
-    scene1, scene2 = mock_scenes[:2]
+    scene1, scene2 = mock_scenes
 
     # Setup stack
     scene_manager.push_scene(scene1)
@@ -92,7 +92,7 @@ def test_scene_switching(
     scene_manager: SceneManager, mock_scenes: List[MockScene]
 ) -> None:
     """Test scene switching functionality."""
-    scene1, scene2 = mock_scenes[:2]
+    scene1, scene2 = mock_scenes
 
     # Test initial switch
     scene_manager.switch_scene(scene1)
@@ -127,7 +127,7 @@ def test_scene_manager_clear(
     scene_manager: SceneManager, mock_scenes: List[MockScene]
 ) -> None:
     """Test clearing all scenes."""
-    scene1, scene2 = mock_scenes[:2]
+    scene1, scene2 = mock_scenes
 
     # Setup scenes
     scene_manager.push_scene(scene1)
@@ -1,5 +1,4 @@
 """Tests for the tilemap system."""
-import os
 from typing import Tuple
 
 import pygame
@@ -16,31 +15,32 @@ from src.core import (
 from src.core.tilemap import TileLayer
 
 
-def create_test_tileset() -> SpriteSheet:
-    """Create a test tileset.
+@pytest.fixture(scope="module")
+def tileset_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Write the 64x64 test tileset image once for this module.
 
     Returns:
-        SpriteSheet: The created tileset
+        str: Path to the saved tileset image
     """
-    # Create test surface
     surface = pygame.Surface((64, 64))
     surface.fill((255, 255, 255))  # White background
+    path = tmp_path_factory.mktemp("tilemap") / "test_tileset.png"
+    pygame.image.save(surface, str(path))
+    return str(path)
 
-    # Save the tileset
-    pygame.image.save(surface, "test_tileset.png")
 
-    # Create sprite sheet
-    tileset = SpriteSheet("test_tileset.png")
+@pytest.fixture
+def tileset(tileset_path: str) -> SpriteSheet:
+    """Create a test tileset with four 32x32 frames.
 
-    # Add frames
+    Returns:
+        SpriteSheet: The created tileset
+    """
+    tileset = SpriteSheet(tileset_path)
     tileset.add_frame(SpriteFrame(0, 0, 32, 32))
     tileset.add_frame(SpriteFrame(32, 0, 32, 32))
     tileset.add_frame(SpriteFrame(0, 32, 32, 32))
     tileset.add_frame(SpriteFrame(32, 32, 32, 32))
-
-    # Clean up
-    os.remove("test_tileset.png")
-
     return tileset
 
 
@@ -107,9 +107,8 @@ def test_tile_layer_clear_fill() -> None:
             assert layer.get_tile(x, y) is None
 
 
-def test_tilemap_initialization() -> None:
+def test_tilemap_initialization(tileset: SpriteSheet) -> None:
     """Test that tilemap is properly initialized."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
 
     assert tilemap.tile_width == 32
@@ -120,9 +119,8 @@ def test_tilemap_initialization() -> None:
     assert tilemap.time == 0.0
 
 
-def test_tilemap_layer_management() -> None:
+def test_tilemap_layer_management(tileset: SpriteSheet) -> None:
     """Test adding and removing layers."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
 
     # Add layers
@@ -148,9 +146,8 @@ def test_tilemap_layer_management() -> None:
         tilemap.get_layer("background")
 
 
-def test_tilemap_tile_config() -> None:
+def test_tilemap_tile_config(tileset: SpriteSheet) -> None:
     """Test tile configuration."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
 
     # Set tile config
@@ -165,9 +162,8 @@ def test_tilemap_tile_config() -> None:
     assert tilemap.get_tile_config(2) is None
 
 
-def test_tilemap_animation() -> None:
+def test_tilemap_animation(tileset: SpriteSheet) -> None:
     """Test tile animation."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
 
     # Set up animated tile
@@ -193,9 +189,8 @@ def test_tilemap_animation() -> None:
     tilemap.render(surface)
 
 
-def test_tilemap_parallax() -> None:
+def test_tilemap_parallax(tileset: SpriteSheet) -> None:
     """Test parallax scrolling."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
 
     # Add layers with different scroll factors
@@ -219,9 +214,8 @@ def test_tilemap_parallax() -> None:
     # We can't easily test the exact pixels, but the code runs without errors
 
 
-def test_tilemap_opacity() -> None:
+def test_tilemap_opacity(tileset: SpriteSheet) -> None:
     """Test layer opacity."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
 
     # Add layer with partial opacity
@@ -239,9 +233,8 @@ def test_tilemap_opacity() -> None:
     # but the code runs without errors
 
 
-def test_tilemap_visible_range() -> None:
+def test_tilemap_visible_range(tileset: SpriteSheet) -> None:
     """Test calculation of visible tile range."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
     tilemap.add_layer("test", 10, 8)
 
@@ -267,9 +260,8 @@ def test_tilemap_visible_range() -> None:
     assert end_y == 8  # Limited by map height
 
 
-def test_tilemap_width_height() -> None:
+def test_tilemap_width_height(tileset: SpriteSheet) -> None:
     """Test tilemap width and height properties."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
 
     # No layers initially
@@ -286,9 +278,8 @@ def test_tilemap_width_height() -> None:
     assert tilemap.height == 8  # Maximum height
 
 
-def test_tilemap_render_empty() -> None:
+def test_tilemap_render_empty(tileset: SpriteSheet) -> None:
     """Test rendering an empty tilemap."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
     surface = pygame.Surface((320, 240))
 
@@ -296,9 +287,8 @@ def test_tilemap_render_empty() -> None:
     tilemap.render(surface)
 
 
-def test_tilemap_render_invalid_tile() -> None:
+def test_tilemap_render_invalid_tile(tileset: SpriteSheet) -> None:
     """Test rendering with invalid tile IDs."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
     tilemap.add_layer("test", 1, 1)
     layer = tilemap.get_layer("test")
@@ -311,9 +301,8 @@ def test_tilemap_render_invalid_tile() -> None:
     tilemap.render(surface)
 
 
-def test_tilemap_animation_update() -> None:
+def test_tilemap_animation_update(tileset: SpriteSheet) -> None:
     """Test updating tile animations."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
 
     # Set up animated tile
@@ -338,9 +327,8 @@ def test_tilemap_animation_update() -> None:
     assert abs(tilemap.time - 0.1) < 0.001  # Account for floating point precision
 
 
-def test_tilemap_layer_visibility() -> None:
+def test_tilemap_layer_visibility(tileset: SpriteSheet) -> None:
     """Test layer visibility control."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
 
     # Add a layer and make it invisible
@@ -358,9 +346,8 @@ def test_tilemap_layer_visibility() -> None:
     assert surface.get_at((0, 0)) == (0, 0, 0, 255)
 
 
-def test_tilemap_collision_layer() -> None:
+def test_tilemap_collision_layer(tileset: SpriteSheet) -> None:
     """Test setting and using the collision layer."""
-    tileset = create_test_tileset()
     tilemap = Tilemap(32, 32, tileset)
     tilemap.add_layer("background", 10, 10, TileLayerConfig())
     tilemap.add_layer("collision", 10, 10, TileLayerConfig())
@@ -404,7 +391,7 @@ def test_tilemap_collision_layer() -> None:
     ],
 )
 def test_tilemap_collision_detection(
-    rect: pygame.Rect, expected: Tuple[Vector2D, float]
+    tileset: SpriteSheet, rect: pygame.Rect, expected: Tuple[Vector2D, float]
 ) -> None:
     """Test collision detection and normal calculation.
 
@@ -413,7 +400,7 @@ def test_tilemap_collision_detection(
         expected: Expected (normal, penetration) tuple
     """
     # Create a simple tilemap with one solid tile in the center
-    tilemap = Tilemap(32, 32, create_test_tileset())
+    tilemap = Tilemap(32, 32, tileset)
     tilemap.add_layer("collision", 3, 3)
     tilemap.set_collision_layer("collision")
 
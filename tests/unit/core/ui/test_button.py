@@ -1,22 +1,16 @@
 """Tests for the Button UI element."""
-from typing import Generator
-
 import pygame
 import pytest
 
-from src.core.ui.button import Button, ButtonStyle
+from src.core.ui.button import Button, ButtonStyle, _make_button_surface
 from src.core.ui.ui_element import UIRect
 
 
 @pytest.fixture(autouse=True)
-def setup_pygame() -> Generator[None, None, None]:
-    """Set up pygame for testing."""
-    pygame.init()
-    pygame.display.set_mode((800, 600))
+def setup_pygame() -> None:
+    """Reset input state left over from other tests."""
     pygame.event.get()  # Clear event queue
     pygame.mouse.set_pos((0, 0))  # Reset mouse position
-    yield None
-    pygame.quit()
 
 
 @pytest.fixture
@@ -264,3 +258,73 @@ def test_button_text_alignment() -> None:
     assert (
         text_bounds.height <= button_bounds.height - style.padding[1] - style.padding[3]
     )
+
+
+def test_button_background_cache() -> None:
+    """Test that buttons with the same look share a rendered background."""
+    _make_button_surface.cache_clear()
+    style = ButtonStyle(corner_radius=10, border_color=(0, 0, 0), border_width=2)
+    surface = pygame.Surface((400, 300))
+
+    for x in (20, 140, 260):
+        button = Button("Cached", UIRect(x=x, y=100, width=100, height=50), style)
+        button.render(surface)
+
+    info = _make_button_surface.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert surface.get_at((160, 125))[:3] == style.background_color
+
+
+def test_button_update_advances_text_once(button: Button) -> None:
+    """Test that a button update advances its text exactly one step."""
+    button.text_element.config.animation_speed = 10.0  # Characters per second
+
+    button.update(0.1)
+
+    assert button.text_element._animation_progress == pytest.approx(1.0)
+
+
+def test_button_style_looks() -> None:
+    """Test that per-state looks are precomputed from the style."""
+    style = ButtonStyle(border_color=(1, 2, 3), border_width=0, corner_radius=4)
+
+    assert style._looks == (
+        (style.background_color, None, 0, 4),
+        (style.hover_color, None, 0, 4),
+        (style.pressed_color, None, 0, 4),
+    )
+    with pytest.raises(AttributeError):
+        style.hover_color = (0, 0, 0)  # type: ignore[misc]
+
+
+def test_button_style_color_values() -> None:
+    """Test that pygame.Color and list colors can be rendered and cached."""
+    _make_button_surface.cache_clear()
+    style = ButtonStyle(
+        background_color=pygame.Color(10, 20, 30),  # type: ignore[arg-type]
+        hover_color=[40, 50, 60],  # type: ignore[arg-type]
+        border_color=pygame.Color("white"),  # type: ignore[arg-type]
+        border_width=1,
+    )
+    assert style.background_color == (10, 20, 30, 255)
+    assert style.hover_color == (40, 50, 60)
+
+    surface = pygame.Surface((200, 100))
+    for _ in range(2):
+        Button("Colors", UIRect(x=0, y=0, width=100, height=50), style).render(surface)
+    assert _make_button_surface.cache_info().hits == 1
+    assert surface.get_at((50, 25))[:3] == (10, 20, 30)
+
+
+def test_button_text_bounds() -> None:
+    """Test that text is laid out inside the button's padded area."""
+    style = ButtonStyle(padding=(10, 5, 10, 5))
+    button = Button("Padded", UIRect(x=100, y=100, width=200, height=50), style)
+
+    text_bounds = button._get_text_bounds()
+    assert text_bounds == pygame.Rect(110, 105, 180, 40)
+    assert button._get_text_bounds() is text_bounds
+
+    button.rect = UIRect(x=150, y=100, width=200, height=50)
+    assert button._get_text_bounds() == pygame.Rect(160, 105, 180, 40)
@@ -53,10 +53,6 @@ def test_text_animation(text_element: Text) -> None:
 
 def test_text_shadow() -> None:
     """Test text shadow rendering."""
-    # Initialize pygame for surface creation
-    pygame.init()
-    pygame.display.set_mode((800, 600))
-
     # Create text with shadow
     config = TextConfig(
         font_size=16,
@@ -75,15 +71,9 @@ def test_text_shadow() -> None:
     assert text._surface.get_width() > 0
     assert text._surface.get_height() > 0
 
-    pygame.quit()
-
 
 def test_text_alignment() -> None:
     """Test text alignment options."""
-    # Initialize pygame for surface creation
-    pygame.init()
-    pygame.display.set_mode((800, 600))
-
     # Test left alignment (default)
     left_text = Text(
         "Left",
@@ -117,8 +107,6 @@ def test_text_alignment() -> None:
     assert bounds.x == 0  # Base position is still 0
     # Right alignment is handled in render
 
-    pygame.quit()
-
 
 def test_text_font_loading(text_element: Text) -> None:
     """Test font loading."""
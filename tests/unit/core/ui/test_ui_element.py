@@ -2,7 +2,7 @@
 import pygame
 import pytest
 
-from src.core.ui import UIElement, UIRect
+from src.core.ui import UIElement, UIRect, set_screen_rect
 
 
 @pytest.fixture
@@ -73,10 +73,6 @@ def test_ui_element_z_index(ui_element: UIElement) -> None:
 
 def test_ui_element_bounds_calculation(ui_element: UIElement) -> None:
     """Test bounds calculation."""
-    # Initialize pygame for surface creation
-    pygame.init()
-    pygame.display.set_mode((800, 600))
-
     bounds = ui_element.get_bounds()
     assert bounds.x == 10
     assert bounds.y == 20
@@ -91,28 +87,16 @@ def test_ui_element_bounds_calculation(ui_element: UIElement) -> None:
     assert bounds.width == 200  # 25% of 800
     assert bounds.height == 150  # 25% of 600
 
-    pygame.quit()
-
 
 def test_ui_element_contains_point(ui_element: UIElement) -> None:
     """Test point containment check."""
-    # Initialize pygame for surface creation
-    pygame.init()
-    pygame.display.set_mode((800, 600))
-
     assert ui_element.contains_point((15, 25))  # Inside
     assert not ui_element.contains_point((5, 5))  # Outside
     assert not ui_element.contains_point((150, 150))  # Outside
 
-    pygame.quit()
-
 
 def test_ui_element_anchoring(ui_element: UIElement) -> None:
     """Test anchor point positioning."""
-    # Initialize pygame for surface creation
-    pygame.init()
-    pygame.display.set_mode((800, 600))
-
     # Test center anchoring
     centered = UIElement(
         UIRect(x=400, y=300, width=100, height=50, anchor_x=0.5, anchor_y=0.5)
@@ -129,17 +113,11 @@ def test_ui_element_anchoring(ui_element: UIElement) -> None:
     assert bounds.x == 700  # 800 - 100
     assert bounds.y == 550  # 600 - 50
 
-    pygame.quit()
-
 
 def test_ui_element_event_handling(
     ui_element: UIElement, child_element: UIElement
 ) -> None:
     """Test event handling and propagation."""
-    # Initialize pygame for event handling
-    pygame.init()
-    pygame.display.set_mode((800, 600))
-
     # Add child element
     ui_element.add_child(child_element)
 
@@ -153,8 +131,6 @@ def test_ui_element_event_handling(
     event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"pos": (15, 25), "button": 1})
     assert ui_element.handle_event(event)
 
-    pygame.quit()
-
 
 def test_ui_element_update(ui_element: UIElement, child_element: UIElement) -> None:
     """Test update propagation."""
@@ -167,3 +143,65 @@ def test_ui_element_update(ui_element: UIElement, child_element: UIElement) -> N
     # Test enabled state
     ui_element.enabled = True
     ui_element.update(0.016)  # Should update self and child
+
+
+def test_ui_element_uses_slots(ui_element: UIElement) -> None:
+    """Test that UI elements store their state in slots."""
+    assert not hasattr(ui_element, "__dict__")
+    with pytest.raises(AttributeError):
+        ui_element.unknown_attribute = 1  # type: ignore[attr-defined]
+
+
+def test_ui_element_screen_rect_follows_parent(
+    ui_element: UIElement, child_element: UIElement
+) -> None:
+    """Test that cached screen rects are refreshed when an ancestor moves."""
+    ui_element.add_child(child_element)
+    assert child_element.screen_rect.topleft == (15, 25)
+
+    ui_element.rect = UIRect(x=30, y=40, width=100, height=50)
+    assert child_element.screen_rect.topleft == (35, 45)
+
+    child_element.rect = UIRect(x=10, y=10, width=50, height=25)
+    assert child_element.screen_rect.topleft == (40, 50)
+
+
+def test_ui_element_children_sorted_by_z_index(ui_element: UIElement) -> None:
+    """Test that children stay ordered by z-index as they change."""
+    first = UIElement()
+    second = UIElement()
+    third = UIElement()
+    second.z_index = 2
+    ui_element.add_child(first)
+    ui_element.add_child(second)
+    ui_element.add_child(third)
+    assert ui_element._children == [first, third, second]
+
+    first.z_index = 5
+    assert ui_element._children == [third, second, first]
+
+    third.z_index = 2  # Ties go after existing children with the same z-index
+    assert ui_element._children == [second, third, first]
+
+
+def test_ui_element_uses_screen_rect_cache() -> None:
+    """Test that root elements lay out against the configured screen rect."""
+    element = UIElement(UIRect(x=0.5, y=0.5, width=0.25, height=0.25))
+    set_screen_rect(pygame.Rect(0, 0, 400, 200))
+    try:
+        assert element.get_bounds() == pygame.Rect(200, 100, 100, 50)
+    finally:
+        set_screen_rect(None)
+
+
+def test_ui_element_ignores_non_pointer_events(
+    ui_element: UIElement, child_element: UIElement
+) -> None:
+    """Test that non-pointer events are rejected without walking children."""
+    ui_element.add_child(child_element)
+
+    event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_SPACE})
+    assert not ui_element.handle_event(event)
+
+    event = pygame.event.Event(pygame.MOUSEMOTION, {"pos": (15, 25)})
+    assert ui_element.handle_event(event)